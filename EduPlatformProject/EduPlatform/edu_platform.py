@@ -1,43 +1,88 @@
-import json
 from models.users import User, Student, Teacher, Parent, Admin
-from models.assignments import Assignment
+from models.assignments import Assignment, MAX_SUBMISSION_CHARS
 from models.grades import Grade
-from models.schedules import Schedule
+from models.schedules import Schedule, lesson_minute
 from core.enums import UserRole, AssignmentDifficulty, AssignmentStatus
+from core.serialization import json_dumps, json_dumps_bytes
 import csv
+import hashlib
 import openpyxl
 import datetime # For export logging
 import os
+import threading
+import traceback
+import time
+import concurrent.futures
+import operator
+import logging
+
+logger = logging.getLogger(__name__)
+
 class EduPlatform:
     """
     The central class for the EduPlatform.
     Manages all in-memory data (users, assignments, grades, schedules)
     and provides methods for system-wide operations.
     """
-    def __init__(self):
+    def __init__(self, auto_export: bool = False):
+        """
+        auto_export: If True, changes are exported automatically in the background.
+        Otherwise they are only exported when flush_exports() is called.
+        """
         # Initialize data stores
         self.users = {}       # Stores User objects by ID
         self.assignments = {} # Stores Assignment objects by ID
         self.grades = {}      # Stores Grade objects by ID
         self.schedules = {}   # Stores Schedule objects by ID
+        self.users_by_email = {} # Stores User objects by email for O(1) lookups
+        self.users_by_role = {role: {} for role in UserRole} # {role: {user_id: User}}, lets reports scan one role
+        self.students_by_class = {}  # {class_id: set of student IDs}
+        self.parents_of_student = {} # {student_id: set of parent IDs}
+        self.children_by_parent = {} # {parent_id: the parent's children IDs as last indexed}, see _index_children
+        self.teacher_busy = {}       # {teacher_id: {lowercased day: bitmask of the minutes of the day taken by a lesson}}
+        self.grades_by_student = {}      # {student_id: set of grade IDs}
+        self.grades_by_teacher = {}      # {teacher_id: set of grade IDs}
+        self.assignments_by_teacher = {} # {teacher_id: set of assignment IDs}
         
-        # Initialize counters for next available IDs (if not handled by individual models)
-        # It's better if models manage their own _next_id, but if EduPlatform assigns them,
-        # you'd have self.next_user_id, self.next_assignment_id, etc.
-        # Assuming your models already have _next_id for now.
+        # IDs are assigned by the models themselves, each from a class-level itertools.count.
 
-        self.export_log = [] # Initialize a list to store export events
+        self.export_log = [] # Export events as (datetime, type, file names); formatted only when viewed or saved
+        self._saved_log_counts = {} # {log file path: number of export_log entries already written to it}
 
         # Define base export directories relative to where the script is run
         self.EXPORT_CSV_DIR = "exported_csv"
         self.EXPORT_XLSX_DIR = "exported_xlsx"
         self.EXPORT_SQL_DIR = "exported_sql"
+        self.EXPORT_BUFFER_SIZE = 1 << 20 # 1 MiB write buffer for export files, fewer write syscalls
+        self.SQL_INSERT_BATCH_SIZE = 500 # Rows per multi-row INSERT (SQL Server allows at most 1000)
 
         # Create export directories if they don't exist
         os.makedirs(self.EXPORT_CSV_DIR, exist_ok=True)
         os.makedirs(self.EXPORT_XLSX_DIR, exist_ok=True)
         os.makedirs(self.EXPORT_SQL_DIR, exist_ok=True)
 
+        # Incremental export state: IDs changed since the last export, the CSV file (and columns)
+        # each table is currently appended to, and the columns and IDs already in the SQL file.
+        self._dirty_ids = {"users": set(), "assignments": set(), "grades": set(), "schedules": set()}
+        self._dirty_ids_lock = threading.Lock()
+        self._csv_files = {}  # {table_name: (file path, fieldnames)}
+        self._sql_tables = {} # {table_name: (columns, value formatters, set of exported IDs)}
+        self._row_hashes = {} # {table_name: {id: digest of the record as last exported}}
+        self._data_version = 0        # Bumped on every change
+        self._export_snapshot = None  # (data version, export data) cached by _get_data_for_export
+
+        # Mutations only mark the data dirty. With auto-export on, a single background
+        # worker coalesces bursts of changes into one (debounced) export; otherwise the
+        # pending changes are exported by flush_exports().
+        self.auto_export_enabled = auto_export
+        self.EXPORT_DEBOUNCE_SECONDS = 0.5
+        self._dirty = threading.Event()
+        self._export_lock = threading.Lock()
+        self._export_thread = None
+        if self.auto_export_enabled:
+            self._export_thread = threading.Thread(target=self._export_worker, daemon=True)
+            self._export_thread.start()
+
         # Initialize the admin user at startup
         self._initialize_admin()
 
@@ -45,7 +90,7 @@ class EduPlatform:
         """Initializes a default admin user if no users exist."""
         if not self.users:
             admin_user = Admin("Super Admin", "admin@eduplatform.com", "adminpass")
-            self.users[admin_user.id] = admin_user
+            self.store_user(admin_user)
             print(f"Initial Admin user created: {admin_user.full_name} (ID: {admin_user.id})")
 
     # --- User Management Methods ---
@@ -54,96 +99,169 @@ class EduPlatform:
         Registers a new user into the platform.
         """
         # Check for existing email
-        for user in self.users.values():
-            if user.email == email:
-                print(f"Error: User with email '{email}' already exists.")
-                return None
+        if email in self.users_by_email:
+            print(f"Error: User with email '{email}' already exists.")
+            return None
 
         new_user = None
-        if role == UserRole.STUDENT:
+        if role is UserRole.STUDENT: # Enum members are singletons, so identity checks suffice
             grade_level = kwargs.get("grade_level")
             if not grade_level:
                 print("Error: Student registration requires 'grade_level'.")
                 return None
             new_user = Student(full_name, email, password, grade_level)
-        elif role == UserRole.TEACHER:
+        elif role is UserRole.TEACHER:
             new_user = Teacher(full_name, email, password)
-        elif role == UserRole.PARENT:
+        elif role is UserRole.PARENT:
             new_user = Parent(full_name, email, password)
             children_ids = kwargs.get("children_ids")
             if children_ids and isinstance(children_ids, list):
                 for child_id in children_ids:
-                    if child_id in self.users and isinstance(self.users[child_id], Student):
-                        new_user.children.append(child_id)
+                    child = self.users.get(child_id)
+                    if isinstance(child, Student):
+                        new_user.add_child(child) # Indexed in parents_of_student below
                     else:
                         print(f"Warning: Child ID {child_id} not found or not a student.")
-        elif role == UserRole.ADMIN:
+        elif role is UserRole.ADMIN:
             new_user = Admin(full_name, email, password)
         else:
             print(f"Error: Invalid user role '{role.value}'.")
             return None
 
-        if new_user:
-            self.users[new_user.id] = new_user
+        if new_user and self.store_user(new_user):
             print(f"Successfully registered {role.value}: {full_name} (ID: {new_user.id})")
             return new_user
         return None
 
+    def store_user(self, new_user: User) -> bool:
+        """
+        Adds a newly created user to the platform: the users dict, every user index (email, role,
+        class, parent links) and the change listener, and marks the user for export.
+        Used by register_user and by Admin.add_user/add_users_bulk.
+        Returns False (and stores nothing) if the email is already taken.
+        """
+        if new_user.email in self.users_by_email:
+            print(f"Error: User with email '{new_user.email}' already exists.")
+            return False
+        self.users[new_user.id] = new_user
+        self.users_by_email[new_user.email] = new_user
+        self.users_by_role[new_user.role][new_user.id] = new_user
+        if new_user.role is UserRole.STUDENT:
+            self.students_by_class.setdefault(new_user.grade, set()).add(new_user.id) # Keyed by the interned class ID
+        elif new_user.role is UserRole.PARENT:
+            self._index_children(new_user)
+        new_user._change_listener = self._on_user_changed
+        self._mark_dirty("users", new_user.id)
+        return True
+
+    def _on_user_changed(self, user: User):
+        """
+        Change listener of every registered user, so changes made on the user object itself
+        (e.g. student.update_profile(grade_level=...)) keep the platform's indexes in step
+        and reach the next incremental export.
+        """
+        if self.users.get(user.id) is not user:
+            return # Removed from the platform
+        self._mark_dirty("users", user.id)
+        self.export_data_on_change()
+        if self.users_by_email.get(user.email) is not user:
+            # The email changed: move the user's entry in the email index (found by identity)
+            for email, indexed_user in self.users_by_email.items():
+                if indexed_user is user:
+                    del self.users_by_email[email]
+                    break
+            if self.users_by_email.setdefault(user.email, user) is not user:
+                print(f"Warning: Email '{user.email}' is already used by another user; {user.full_name} can't log in with it.")
+        if user.role is UserRole.STUDENT and user.id not in self.students_by_class.get(user.grade, ()):
+            # The student moved to another class: re-key the class index (a handful of classes to scan)
+            for class_students in self.students_by_class.values():
+                class_students.discard(user.id)
+            self.students_by_class.setdefault(user.grade, set()).add(user.id)
+        elif user.role is UserRole.PARENT:
+            self._index_children(user) # e.g. parent.update_profile(children=[...])
+
+    def _index_children(self, parent: Parent):
+        """
+        Brings parents_of_student in step with the parent's children, however they were set
+        (add_child, update_profile(children=...) or the constructor's children IDs).
+        Only the children added or removed since the parent was last indexed are touched.
+        """
+        indexed_children = self.children_by_parent.get(parent.id, set())
+        if parent.children == indexed_children:
+            return
+        for child_id in indexed_children - parent.children:
+            self.parents_of_student.get(child_id, set()).discard(parent.id)
+        for child_id in parent.children - indexed_children:
+            if isinstance(self.users.get(child_id), Student):
+                self.parents_of_student.setdefault(child_id, set()).add(parent.id)
+        self.children_by_parent[parent.id] = set(parent.children)
+
     def get_user(self, user_id: int) -> User | None:
         """Retrieves a user by their ID."""
         return self.users.get(user_id)
 
     def authenticate_user(self, email: str, password: str) -> User | None:
         """Authenticates a user and returns the user object if successful."""
-        for user in self.users.values():
-            if user.email == email:
-                if user.authenticate(password):
-                    print(f"Authentication successful for {user.full_name} ({user.role.value}).")
-                    return user
-                else:
-                    print("Authentication failed: Incorrect password.")
-                    return None
-        print(f"Authentication failed: User with email '{email}' not found.")
+        user = self.users_by_email.get(email)
+        if user is None:
+            print(f"Authentication failed: User with email '{email}' not found.")
+            return None
+        if user.authenticate(password):
+            print(f"Authentication successful for {user.full_name} ({user.role.value}).")
+            return user
+        print("Authentication failed: Incorrect password.")
         return None
 
     def remove_user(self, user_id: int) -> bool:
         """Removes a user from the platform and cleans up related data."""
         if user_id not in self.users:
-            print(f"Error: User with ID {user_id} not found.")
+            logger.warning("Error: User with ID %s not found.", user_id)
             return False
 
         user_to_remove = self.users[user_id]
         user_role = user_to_remove.role
 
         # Clean up related data based on role (simple cleanup for now)
-        if user_role == UserRole.STUDENT:
-            # Remove student's grades and submissions from assignments
-            for assignment in self.assignments.values():
-                if user_id in assignment.submissions:
-                    del assignment.submissions[user_id]
-                if user_id in assignment.grades:
-                    del assignment.grades[user_id]
+        if user_role is UserRole.STUDENT:
+            # Remove student's grades and submissions from the assignments they submitted
+            for assignment_id in user_to_remove.assignments:
+                assignment = self.assignments.get(assignment_id)
+                if assignment is not None:
+                    assignment.remove_student(user_id)
+                    self.users[assignment.teacher_id]._invalidate_profile() # Lists the assignment's submissions
             # Remove grades directly associated with this student
-            self.grades = {g_id: g for g_id, g in self.grades.items() if g.student_id != user_id}
-            # Remove student from parent's children list
-            for parent_user in self.users.values():
-                if isinstance(parent_user, Parent) and user_id in parent_user.children:
-                    parent_user.children.remove(user_id)
-
-        elif user_role == UserRole.TEACHER:
+            for grade_id in self.grades_by_student.pop(user_id, ()):
+                grade = self.grades.pop(grade_id)
+                self.grades_by_teacher[grade.teacher_id].discard(grade_id)
+            # Remove student from parent's children and from the class index
+            for parent_id in self.parents_of_student.pop(user_id, ()):
+                self.users[parent_id].remove_child(user_id)
+            self.students_by_class.get(user_to_remove.grade, set()).discard(user_id)
+
+        elif user_role is UserRole.TEACHER:
             # Remove assignments created by this teacher
-            assignments_to_remove_ids = [aid for aid, a in self.assignments.items() if a.teacher_id == user_id]
-            for aid in assignments_to_remove_ids:
+            for aid in self.assignments_by_teacher.pop(user_id, ()):
                 del self.assignments[aid]
             # Remove grades given by this teacher
-            self.grades = {g_id: g for g_id, g in self.grades.items() if g.teacher_id != user_id}
+            for grade_id in self.grades_by_teacher.pop(user_id, ()):
+                grade = self.grades.pop(grade_id)
+                self.grades_by_student[grade.student_id].discard(grade_id)
+            # Free the teacher's booked lesson slots
+            self.teacher_busy.pop(user_id, None)
             # Consider removing teacher from schedules, though more complex.
 
-        elif user_role == UserRole.PARENT:
-            # No specific data to remove directly linked to parent beyond their own object
-            pass # Children references are managed from the Student side
+        elif user_role is UserRole.PARENT:
+            # Drop the parent from the reverse index of each of their children
+            for child_id in self.children_by_parent.pop(user_id, ()):
+                self.parents_of_student.get(child_id, set()).discard(user_id)
 
+        user_to_remove._change_listener = None
         del self.users[user_id]
+        if self.users_by_email.get(user_to_remove.email) is user_to_remove: # Not if the email clashed on a change
+            del self.users_by_email[user_to_remove.email]
+        del self.users_by_role[user_role][user_id]
+        self._reset_incremental_export() # Append-only exports cannot express deletions
+        self.export_data_on_change() # Automatic export (a full rewrite, without the removed user)
         print(f"User {user_to_remove.full_name} (ID: {user_id}, Role: {user_role.value}) removed successfully.")
         return True
 
@@ -163,38 +281,52 @@ class EduPlatform:
             title, description, deadline, subject, class_id, difficulty, self.assignments # Pass self.assignments
         )
         # The assignment is already added to self.assignments and teacher.assignments by the teacher method
+        self.assignments_by_teacher.setdefault(teacher_id, set()).add(new_assignment.id)
+        self._mark_dirty("assignments", new_assignment.id)
         
-        # Notify relevant students and parents
-        for user_id, user_obj in self.users.items():
-            if isinstance(user_obj, Student) and user_obj.grade == class_id:
-                user_obj.add_notification(
-                    f"New assignment: '{title}' in {subject} due by {deadline}.", priority="important"
+        # Notify relevant students and parents (each notified user is marked dirty by its change listener)
+        users = self.users
+        created_at = datetime.datetime.now().isoformat() # One timestamp for all notifications of this assignment
+        for student_id in self.students_by_class.get(class_id, ()):
+            student = users[student_id]
+            student.add_notification(
+                f"New assignment: '{title}' in {subject} due by {deadline}.", priority="important", created_at=created_at
+            )
+            # Also notify their parents who want new assignment alerts
+            allowed_parents = [users[parent_id] for parent_id in self.parents_of_student.get(student_id, ())
+                               if users[parent_id].notification_preferences.get("new_assignment_alert", True)]
+            for parent_user in allowed_parents:
+                parent_user.add_notification(
+                    f"New assignment for {student.full_name}: '{title}' in {subject}.", priority="normal", created_at=created_at
                 )
-                # Also notify their parents
-                for parent_user in self.users.values():
-                    if isinstance(parent_user, Parent) and user_obj.id in parent_user.children and \
-                       parent_user.notification_preferences.get("new_assignment_alert", True):
-                       parent_user.add_notification(
-                           f"New assignment for {user_obj.full_name}: '{title}' in {subject}.", priority="normal"
-                       )
         self.export_data_on_change() # Automatic export
         return new_assignment
 
-    def submit_assignment(self, student_id: int, assignment_id: int, content: str) -> bool:
+    def submit_assignment(self, student_id: int, assignment_id: int, content: str, today: datetime.date = None) -> bool:
         """
         Student submits an assignment.
+        today optionally pins the date checked against the deadline (see Student.submit_assignment).
         """
+        # Cheapest check first: oversized content is rejected before any lookup, dirty marking or export
+        if len(content) > MAX_SUBMISSION_CHARS:
+            logger.warning("Error: Assignment content exceeds %s characters. Current length: %s", MAX_SUBMISSION_CHARS, len(content))
+            return False
+
         student = self.get_user(student_id)
         if not isinstance(student, Student):
-            print(f"Error: User ID {student_id} is not a student.")
+            logger.warning("Error: User ID %s is not a student.", student_id)
             return False
 
         assignment = self.assignments.get(assignment_id)
         if not assignment:
-            print(f"Error: Assignment ID {assignment_id} not found.")
+            logger.warning("Error: Assignment ID %s not found.", assignment_id)
             return False
         
-        result = student.submit_assignment(assignment_id, content, self.assignments) # Pass self.assignments
+        result = student.submit_assignment(assignment_id, content, self.assignments, today=today) # Pass self.assignments
+        # The teacher's profile lists the assignment with its submissions, so it changed as well
+        self.users[assignment.teacher_id]._invalidate_profile()
+        self._mark_dirty("assignments", assignment_id)
+        self._mark_dirty("users", student_id, assignment.teacher_id)
         self.export_data_on_change() # Automatic export
         return result
 
@@ -205,23 +337,23 @@ class EduPlatform:
         """
         teacher = self.get_user(teacher_id)
         if not isinstance(teacher, Teacher):
-            print(f"Error: User ID {teacher_id} is not a teacher.")
+            logger.warning("Error: User ID %s is not a teacher.", teacher_id)
             return False
 
         student = self.get_user(student_id)
         if not isinstance(student, Student):
-            print(f"Error: User ID {student_id} is not a student.")
+            logger.warning("Error: User ID %s is not a student.", student_id)
             return False
 
         assignment = self.assignments.get(assignment_id)
         if not assignment:
-            print(f"Error: Assignment ID {assignment_id} not found.")
+            logger.warning("Error: Assignment ID %s not found.", assignment_id)
             return False
 
         # Ensure the teacher is authorized to grade this subject/assignment if needed
         # (e.g., check if teacher.subjects contains assignment.subject)
         if assignment.subject not in teacher.subjects:
-             print(f"Error: Teacher {teacher.full_name} does not teach {assignment.subject}.")
+             logger.warning("Error: Teacher %s does not teach %s.", teacher.full_name, assignment.subject)
              return False
 
         # Use the Teacher's method to handle the grading logic
@@ -231,21 +363,27 @@ class EduPlatform:
             # Create a Grade object and add it to the platform's global grades
             new_grade_obj = Grade(student_id, assignment.subject, grade_value, teacher_id, comment)
             self.grades[new_grade_obj.id] = new_grade_obj
+            self.grades_by_student.setdefault(student_id, set()).add(new_grade_obj.id)
+            self.grades_by_teacher.setdefault(teacher_id, set()).add(new_grade_obj.id)
+            self._mark_dirty("grades", new_grade_obj.id)
+            self._mark_dirty("assignments", assignment_id)
+            # The student and the teacher (whose profile lists the graded assignment) were marked dirty
+            # by their change listener while grading, as is every user notified below
 
             # Notify student about the grade
             student.add_notification(
                 f"You received a grade of {grade_value} for assignment '{assignment.title}' in {assignment.subject}.",
-                priority="important"
+                priority="important", created_at=new_grade_obj.date # Reuse the grade's timestamp
             )
             # Notify parent about the grade if notification preference is on and grade is low
             if grade_value <= 2: # Example: Notify for low grades (2 or less)
-                for parent_user in self.users.values():
-                    if isinstance(parent_user, Parent) and student_id in parent_user.children and \
-                       parent_user.notification_preferences.get("low_grade_alert", True):
-                       parent_user.add_notification(
-                           f"Warning: Your child {student.full_name} received a low grade ({grade_value}) for '{assignment.title}'.",
-                           priority="important"
-                       )
+                allowed_parents = [self.users[parent_id] for parent_id in self.parents_of_student.get(student_id, ())
+                                   if self.users[parent_id].notification_preferences.get("low_grade_alert", True)]
+                for parent_user in allowed_parents:
+                    parent_user.add_notification(
+                        f"Warning: Your child {student.full_name} received a low grade ({grade_value}) for '{assignment.title}'.",
+                        priority="important", created_at=new_grade_obj.date
+                    )
         self.export_data_on_change() # Automatic export
         return success
 
@@ -260,6 +398,7 @@ class EduPlatform:
 
         new_schedule = Schedule(class_id, day)
         self.schedules[new_schedule.id] = new_schedule
+        self._mark_dirty("schedules", new_schedule.id)
         print(f"Schedule created for class {class_id} on {day} (ID: {new_schedule.id}).")
         self.export_data_on_change() # Automatic export
         return new_schedule
@@ -276,17 +415,50 @@ class EduPlatform:
             print(f"Error: Teacher with ID {teacher_id} not found or is not a teacher.")
             return False
 
-        # Check for teacher's availability (optimization)
-        for sched in self.schedules.values():
-            if sched.id != schedule_id: # Don't check against the same schedule being modified
-                for lesson_time, lesson_info in sched.lessons.items():
-                    if lesson_info['teacher_id'] == teacher_id and lesson_time == time and sched.day == schedule.day:
-                        print(f"Error: Teacher {teacher.full_name} is already scheduled for {sched.class_id} "
-                              f"at {time} on {schedule.day}.")
-                        return False
+        # Teacher availability across all schedules is one AND against the teacher's bitmask for the day;
+        # conflicts within this schedule (and the time format) are checked by schedule.add_lesson.
+        slot_bit = self._lesson_slot_bit(time)
+        day_key = schedule.day.lower() # Days match case-insensitively, as in create_schedule
+        busy_days = self.teacher_busy.get(teacher_id, {})
+        if busy_days.get(day_key, 0) & slot_bit:
+            print(f"Error: Teacher {teacher.full_name} is already scheduled at {time} on {schedule.day}.")
+            return False
 
         success = schedule.add_lesson(time, subject, teacher_id)
-        self.export_data_on_change() # Automatic export
+        if success:
+            busy_days = self.teacher_busy.setdefault(teacher_id, {})
+            busy_days[day_key] = busy_days.get(day_key, 0) | slot_bit
+            self._mark_dirty("schedules", schedule_id)
+            self.export_data_on_change() # Automatic export, only if the schedule changed
+        return success
+
+    @staticmethod
+    def _lesson_slot_bit(time: str) -> int:
+        """
+        Returns the bit of a lesson's "HH:MM" start time in a teacher's per-day bitmask
+        (bit n is minute n of the day), or 0 if the time is invalid.
+        """
+        minute = lesson_minute(time)
+        if minute is None:
+            return 0 # schedule.add_lesson rejects the time
+        return 1 << minute
+
+    def remove_lesson_from_schedule(self, schedule_id: int, time: str) -> bool:
+        """Removes a lesson from a schedule and frees the teacher's slot for that day and time."""
+        schedule = self.schedules.get(schedule_id)
+        if not schedule:
+            print(f"Error: Schedule with ID {schedule_id} not found.")
+            return False
+
+        lesson = schedule.lesson_at(time)
+        success = schedule.remove_lesson(time)
+        if success:
+            busy_days = self.teacher_busy.get(lesson["teacher_id"], {})
+            day_key = schedule.day.lower()
+            if day_key in busy_days:
+                busy_days[day_key] &= ~self._lesson_slot_bit(time)
+            self._mark_dirty("schedules", schedule_id)
+            self.export_data_on_change() # Automatic export
         return success
 
     # --- Reporting Methods (Admin specific, but managed by EduPlatform) ---
@@ -296,44 +468,161 @@ class EduPlatform:
         """
         admin_user = self.get_user(admin_id)
         if not isinstance(admin_user, Admin):
-            print(f"Error: User ID {admin_id} is not an Admin and cannot generate reports.")
+            logger.warning("Error: User ID %s is not an Admin and cannot generate reports.", admin_id)
             return None
         
         # Pass all relevant data collections to the admin's report method
         all_data = {
             "users": self.users,
+            "users_by_role": self.users_by_role,
             "assignments": self.assignments,
             "grades": self.grades,
             "schedules": self.schedules
         }
         return admin_user.generate_report(report_type, all_data)
 
+    def generate_all_reports(self, admin_id: int, report_types: tuple = Admin.REPORT_TYPES) -> dict | None:
+        """
+        Generates several reports at once, e.g. for an admin dashboard.
+        The reports only read the data, so they are built in parallel, one thread each.
+        Returns the reports merged into one dict, {report_type: report data}, like generate_report's.
+        """
+        if not isinstance(self.get_user(admin_id), Admin):
+            logger.warning("Error: User ID %s is not an Admin and cannot generate reports.", admin_id)
+            return None
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(report_types) or 1) as executor:
+            reports = list(executor.map(lambda report_type: self.generate_report(admin_id, report_type), report_types))
+        merged = {}
+        for report in reports:
+            merged.update(report)
+        return merged
+
     # --- Data Export Methods ---
-    def _get_data_for_export(self) -> dict:
-        """Helper to collect data for export."""
+    def _export_sources(self) -> dict:
+        """Maps each exported table to its data store and the method that serializes one record."""
         return {
-            "users": [user.get_profile() for user in self.users.values()],
-            "assignments": [assign.get_assignment_info() for assign in self.assignments.values()],
-            "grades": [grade.get_grade_info() for grade in self.grades.values()],
-            "schedules": [schedule.view_schedule() for schedule in self.schedules.values()]
+            "users": (self.users, lambda user: user.get_profile()),
+            "assignments": (self.assignments, lambda assign: assign.get_assignment_info()),
+            "grades": (self.grades, lambda grade: grade.get_grade_info()),
+            "schedules": (self.schedules, lambda schedule: schedule.get_schedule_info())
         }
-        
-    def _log_export_event(self, export_type: str, file_name: str):
-        """Logs an export event with a timestamp."""
-        timestamp = datetime.datetime.now().isoformat()
-        self.export_log.append({
-            "timestamp": timestamp,
+
+    def _get_table_records(self, table_name: str, ids: set = None) -> list:
+        """Collects the export records of one table, optionally only for the given IDs."""
+        store, serialize = self._export_sources()[table_name]
+        if ids is None:
+            return [serialize(obj) for obj in store.values()]
+        return [serialize(store[obj_id]) for obj_id in ids if obj_id in store]
+
+    def _get_data_for_export(self) -> dict:
+        """
+        Helper to collect data for export.
+        The result is cached until the data changes again, so all exporters share one snapshot.
+        """
+        data_version = self._data_version
+        if self._export_snapshot is not None and self._export_snapshot[0] == data_version:
+            return self._export_snapshot[1]
+        data = {table_name: self._get_table_records(table_name) for table_name in self._export_sources()}
+        self._export_snapshot = (data_version, data)
+        return data
+
+    def _mark_dirty(self, table_name: str, *obj_ids: int):
+        """Records which objects changed so the next export only has to write those rows."""
+        with self._dirty_ids_lock:
+            self._dirty_ids[table_name].update(obj_ids)
+            self._data_version += 1 # Invalidates the cached export snapshot
+
+    def _take_dirty_ids(self) -> dict:
+        """Returns the IDs changed since the last export and starts collecting anew."""
+        with self._dirty_ids_lock:
+            dirty_ids = self._dirty_ids
+            self._dirty_ids = {table_name: set() for table_name in dirty_ids}
+        return dirty_ids
+
+    def _restore_dirty_ids(self, dirty_ids: dict):
+        """Hands IDs taken by a failed export back, so the next export writes their rows again."""
+        with self._dirty_ids_lock:
+            for table_name, ids in dirty_ids.items():
+                self._dirty_ids[table_name].update(ids)
+
+    @staticmethod
+    def _row_digest(record: dict) -> bytes:
+        """Returns a stable digest of an export record (its compact JSON, hashed with BLAKE2b)."""
+        return hashlib.blake2b(json_dumps_bytes(record), digest_size=16).digest()
+
+    def _drop_unchanged_ids(self, changed_ids: dict) -> tuple[dict, dict]:
+        """
+        Narrows the changed IDs down to the records whose content differs from their last export
+        (a rejected submission, for example, still marks its rows dirty), by comparing a digest of
+        each record with the one remembered for it.
+        Returns the narrowed IDs and the new digests ({table_name: {id: digest}}); the digests
+        are only stored with _store_row_hashes once the export succeeded.
+        """
+        export_sources = self._export_sources()
+        narrowed_ids = {}
+        new_hashes = {}
+        for table_name, ids in changed_ids.items():
+            store, serialize = export_sources[table_name]
+            table_hashes = self._row_hashes.get(table_name, {})
+            narrowed_ids[table_name] = set()
+            new_hashes[table_name] = {}
+            for obj_id in ids:
+                obj = store.get(obj_id)
+                if obj is None:
+                    continue # Removed since; deletions force a full export anyway
+                row_hash = self._row_digest(serialize(obj))
+                if table_hashes.get(obj_id) != row_hash:
+                    new_hashes[table_name][obj_id] = row_hash
+                    narrowed_ids[table_name].add(obj_id)
+        return narrowed_ids, new_hashes
+
+    def _store_row_hashes(self, new_hashes: dict):
+        """Remembers the digests of the records an export has just written."""
+        for table_name, table_hashes in new_hashes.items():
+            self._row_hashes.setdefault(table_name, {}).update(table_hashes)
+
+    def _reset_incremental_export(self):
+        """
+        Forces the next CSV and SQL export to be a full rewrite (e.g. after data was deleted).
+        Takes the export lock, so an export running in the background can't store its
+        (pre-reset) file and table state over the reset when it finishes.
+        """
+        with self._export_lock:
+            self._csv_files = {}
+            self._sql_tables = {}
+            self._row_hashes = {}
+            with self._dirty_ids_lock:
+                self._data_version += 1
+
+    def _log_export_event(self, export_type: str, *file_names: str, now: datetime.datetime = None):
+        """
+        Logs an export event with a timestamp (now, if the export did not capture its own time).
+        The raw values are stored; building the log text is left to view_export_log/save_export_log.
+        """
+        self.export_log.append((now or datetime.datetime.now(), export_type, file_names))
+        # print(f"Logged export event: Type='{export_type}', Files={file_names}") # Optional: For debugging
+
+    @staticmethod
+    def _format_log_entry(log_entry: tuple) -> dict:
+        """Turns a stored export event into its displayed/saved form."""
+        timestamp, export_type, file_names = log_entry
+        return {
+            "timestamp": timestamp.isoformat(),
             "type": export_type,
-            "file_name": file_name
-        })
-        # print(f"Logged export event: Type='{export_type}', File='{file_name}'") # Optional: For debugging
+            "file_name": ", ".join(file_names)
+        }
 
     # Add this new method to your EduPlatform class
     def save_export_log(self, log_file_name: str = "export_log.txt"):
         """
         Saves the current export log to a text file.
         Each log entry is written as a JSON string on a new line.
+        The first save to a file rewrites it; later saves only append the entries logged since.
+        With auto-export enabled, pending background exports are finished first so they are logged.
         """
+        if self.auto_export_enabled:
+            self.flush_exports()
         try:
             # We can save it directly in the project root or in a 'logs' folder
             # For simplicity, let's put it in the project root for now.
@@ -342,29 +631,31 @@ class EduPlatform:
             # and then: log_file_path = os.path.join("logs", log_file_name)
             log_file_path = log_file_name # Saves in the current working directory (project root)
 
-            with open(log_file_path, 'w', encoding='utf-8') as f:
-                for entry in self.export_log:
-                    f.write(json.dumps(entry) + '\n') # Write each dictionary as a JSON string
+            saved_count = self._saved_log_counts.get(log_file_path)
+            new_entries = self.export_log[saved_count or 0:]
+            with open(log_file_path, 'wb' if saved_count is None else 'ab') as f:
+                f.writelines(json_dumps_bytes(self._format_log_entry(entry)) + b'\n' for entry in new_entries) # Write each entry as a JSON line
+            self._saved_log_counts[log_file_path] = (saved_count or 0) + len(new_entries)
 
             print(f"Export log successfully saved to {log_file_path}")
         except Exception as e:
             print(f"Error saving export log: {e}")
-            import traceback
             traceback.print_exc()
 
-    def export_to_xlsx(self, filename="eduplatform_data.xlsx"):
-        """Exports all data to an XLSX file, with each table on a separate sheet."""
-        data_to_export = self._get_data_for_export()
-        workbook = openpyxl.Workbook()
+    def export_to_xlsx(self, filename="eduplatform_data.xlsx", data_to_export: dict = None):
+        """
+        Exports all data to an XLSX file, with each table on a separate sheet.
+        The workbook is opened in write-only mode, so rows are streamed to the file
+        instead of being kept in memory as Cell objects.
+        data_to_export is an already collected snapshot; it is collected here if not given.
+        """
+        output_file = os.path.join(self.EXPORT_XLSX_DIR, filename)
+        if data_to_export is None:
+            data_to_export = self._get_data_for_export()
+        workbook = openpyxl.Workbook(write_only=True)
 
-        first_sheet = True
         for sheet_name, records in data_to_export.items():
-            if first_sheet:
-                sheet = workbook.active
-                sheet.title = sheet_name.capitalize()
-                first_sheet = False
-            else:
-                sheet = workbook.create_sheet(title=sheet_name.capitalize())
+            sheet = workbook.create_sheet(title=sheet_name.capitalize()) # Write-only workbooks have no active sheet
 
             if not records:
                 sheet.append(["No data"])
@@ -374,90 +665,237 @@ class EduPlatform:
             headers = list(records[0].keys())
             sheet.append(headers)
 
-            # Write data rows
+            # Write data rows straight from the records. Values are simple types or strings: the models'
+            # get_*_info/get_profile methods serialize lists and dicts to JSON for export.
+            # Records with exactly the header's columns are read with one itemgetter call;
+            # others (users of a different role) fall back to per-column lookups.
+            header_keys = records[0].keys()
+            get_row = operator.itemgetter(*headers) if len(headers) > 1 else None
             for record in records:
-                row_data = [
-                    # This is where the conversion happens.
-                    # Ensure values are simple types or strings.
-                    # The modification in Assignment.get_assignment_info handles this.
-                    record.get(header) for header in headers
-                ]
-                sheet.append(row_data) # This line was failing because of [] or {}
+                if get_row is not None and record.keys() == header_keys:
+                    sheet.append(get_row(record))
+                else:
+                    sheet.append([record.get(header) for header in headers])
         
         try:
-            workbook.save(filename)
-            print(f"Data successfully exported to {filename} (XLSX).")
-            self.export_log.append(f"[{datetime.datetime.now().isoformat()}] Exported to XLSX: {filename}")
+            workbook.save(output_file)
+            print(f"Data successfully exported to {output_file} (XLSX).")
+            self._log_export_event("xlsx", output_file)
         except Exception as e:
             print(f"Error exporting to XLSX: {e}")
+            traceback.print_exc()
+
+    @staticmethod
+    def _csv_rows(records: list, fieldnames: list):
+        """Yields each record as a tuple in fieldnames order, filling missing fields with ''."""
+        field_count = len(fieldnames)
+        # Records with every field (all but role-specific user columns) are read with one C-level itemgetter call
+        get_row = operator.itemgetter(*fieldnames) if field_count > 1 else None
+        for record in records:
+            if get_row is not None and len(record) == field_count:
+                yield get_row(record)
+            else:
+                yield tuple(record.get(field, '') for field in fieldnames)
+
+    @staticmethod
+    def _release_page_cache(f):
+        """
+        Hints the OS that a just-written export file won't be read back, so its pages need not
+        crowd the page cache (where posix_fadvise is available, i.e. not on Windows).
+        """
+        if hasattr(os, "posix_fadvise"):
+            f.flush()
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+    def _export_csv_table(self, table_name: str, timestamp: str, changed_ids: dict = None, data_to_export: dict = None) -> str:
+        """Exports (or appends the changed rows of) one table to CSV and returns the file name."""
+        current_file = self._csv_files.get(table_name)
+        if changed_ids is not None and current_file is not None:
+            file_name, fieldnames = current_file
+            records = self._get_table_records(table_name, changed_ids[table_name])
+            known_fields = set(fieldnames) # Set lookups instead of scanning the column list per key
+            if all(known_fields.issuperset(record) for record in records):
+                if records:
+                    with open(file_name, 'a', newline='', encoding='utf-8', buffering=self.EXPORT_BUFFER_SIZE) as csvfile:
+                        writer = csv.writer(csvfile)
+                        writer.writerows(self._csv_rows(records, fieldnames))
+                    print(f"Appended {len(records)} changed {table_name} row(s) to {file_name} (CSV).")
+                return file_name
+
+        # Full export of the table into a new file
+        if data_to_export is None:
+            data_to_export = self._get_data_for_export()
+        records = data_to_export[table_name]
+        file_name = os.path.join(self.EXPORT_CSV_DIR, f"eduplatform_data_{table_name}_{timestamp}.csv")
+        if records:
+            # Collect all unique fieldnames, since user profiles differ per role
+            fieldnames = sorted(set(key for record in records for key in record))
+            with open(file_name, 'w', newline='', encoding='utf-8', buffering=self.EXPORT_BUFFER_SIZE) as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(fieldnames)
+                writer.writerows(self._csv_rows(records, fieldnames))
+                self._release_page_cache(csvfile)
+            self._csv_files[table_name] = (file_name, fieldnames)
+            print(f"Data for {table_name} successfully exported to {file_name} (CSV).")
+        else:
+            open(file_name, 'a').close() # Create empty file
+            self._csv_files.pop(table_name, None)
+            print(f"No data for {table_name}, created empty {file_name}.")
+        return file_name
 
-    def export_to_csv(self):
+    def export_to_csv(self, changed_ids: dict = None, data_to_export: dict = None) -> bool:
+        """
+        Exports each table to its own timestamped CSV file.
+        If changed_ids ({table_name: set of IDs}) is given, only those rows are appended to the
+        files written by the previous export. A table is rewritten in full when it has no file yet
+        or its changed rows bring new columns. Appended rows supersede earlier rows with the same ID.
+        data_to_export is an already collected snapshot used for full table exports.
+        The tables go to separate files, so they are written in parallel.
+        Returns True if every table was written, False if the export failed.
+        """
         try:
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            now = datetime.datetime.now() # One timestamp for both the file names and the log entry
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
+            table_names = list(self._export_sources())
 
-            # --- User Export (The problematic section) ---
-            users_data = [user.get_profile() for user in self.users.values()]
-            if users_data:
-                # Dynamically collect all unique fieldnames from all user profiles
-                all_user_fieldnames = sorted(list(set(key for user_dict in users_data for key in user_dict.keys())))
-                
-                users_file_name = f"eduplatform_data_users_{timestamp}.csv"
-                with open(users_file_name, 'w', newline='', encoding='utf-8') as csvfile:
-                    writer = csv.DictWriter(csvfile, fieldnames=all_user_fieldnames)
-                    writer.writeheader()
-                    for user_dict in users_data:
-                        # Ensure all fields are present, fill missing with empty string
-                        row_to_write = {field: user_dict.get(field, '') for field in all_user_fieldnames}
-                        writer.writerow(row_to_write)
-                print(f"Data for users successfully exported to {users_file_name} (CSV).")
-            else:
-                users_file_name = f"eduplatform_data_users_{timestamp}.csv"
-                open(users_file_name, 'a').close() # Create empty file
-                print(f"No data for users, created empty {users_file_name}.")
-
-
-            # ... (Rest of your CSV export logic for assignments, grades, schedules) ...
-
-            # Example for assignments (already working, but shown for context)
-            assignments_data = [assign.get_assignment_info() for assign in self.assignments.values()]
-            if assignments_data:
-                assignments_fieldnames = sorted(list(assignments_data[0].keys()))
-                assignments_file_name = f"eduplatform_data_assignments_{timestamp}.csv"
-                with open(assignments_file_name, 'w', newline='', encoding='utf-8') as csvfile:
-                    writer = csv.DictWriter(csvfile, fieldnames=assignments_fieldnames)
-                    writer.writeheader()
-                    writer.writerows(assignments_data)
-                print(f"Data for assignments successfully exported to {assignments_file_name} (CSV).")
-            else:
-                assignments_file_name = f"eduplatform_data_assignments_{timestamp}.csv"
-                open(assignments_file_name, 'a').close()
-                print(f"No data for assignments, created empty {assignments_file_name}.")
-            
-            # ... (grades and schedules logic) ...
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(table_names)) as executor:
+                exported_files = list(executor.map(
+                    lambda table_name: self._export_csv_table(table_name, timestamp, changed_ids, data_to_export),
+                    table_names
+                ))
 
-            self._log_export_event("csv", f"users_{timestamp}.csv, assignments_{timestamp}.csv, etc.")
-            print("--- Auto-export complete ---")
+            self._log_export_event("csv", *exported_files, now=now)
+            return True
 
         except Exception as e:
             print(f"Error exporting to CSV: {e}")
-            import traceback
             traceback.print_exc()
+            return False
 
-    def export_to_sql(self, filename="eduplatform_data.sql"):
-        """Generates SQL CREATE TABLE and INSERT INTO statements for SSMS."""
-        data_to_export = self._get_data_for_export()
-
+    @staticmethod
+    def _format_sql_value(value) -> str:
+        """Formats a Python value as an SQL literal (handles None, numbers, strings and complex types)."""
+        if value is None:
+            return "NULL"
+        elif isinstance(value, (int, float)):
+            return str(value)
+        elif isinstance(value, (dict, list)):
+            # Convert dict/list to JSON string for NVARCHAR(MAX); JSON can contain quotes too
+            text = json_dumps(value)
+        else: # Assume string
+            text = str(value)
+        # Escape single quotes (a single str.replace is cheaper than str.translate for one character)
+        return "N'" + text.replace("'", "''") + "'"
+
+    @staticmethod
+    def _infer_sql_type(value) -> str:
+        """
+        Maps a Python value to an SQL Server column type (simplified).
+        isinstance also covers subclasses (e.g. str or int enums); bool is tested before int,
+        since bool is a subclass of int.
+        """
+        if isinstance(value, str):
+            return "NVARCHAR(255)" # NVARCHAR for string flexibility
+        if isinstance(value, bool):
+            return "BIT"
+        if isinstance(value, int):
+            return "INT"
+        if isinstance(value, float):
+            return "FLOAT"
+        return "NVARCHAR(MAX)" # Dicts and lists are stored as JSON strings, anything else as text
+
+    @staticmethod
+    def _format_sql_number(value) -> str:
+        """Formats a value of an INT or FLOAT column as an SQL literal."""
+        return "NULL" if value is None else str(value)
+
+    @staticmethod
+    def _format_sql_bit(value) -> str:
+        """Formats a value of a BIT column as an SQL literal."""
+        return "NULL" if value is None else ("1" if value else "0")
+
+    @classmethod
+    def _sql_formatter(cls, col_type: str):
+        """Returns the function that formats the values of a column with the given SQL type."""
+        if col_type in ("INT", "FLOAT"):
+            return cls._format_sql_number
+        if col_type == "BIT":
+            return cls._format_sql_bit
+        return cls._format_sql_value
+
+    def _sql_insert_batches(self, insert_prefix: str, rows: list) -> list:
+        """Groups value tuples like "(1, N'x')" into multi-row INSERT statements."""
+        batch_size = self.SQL_INSERT_BATCH_SIZE
+        return [insert_prefix + ",\n    ".join(rows[start:start + batch_size]) + ";\n"
+                for start in range(0, len(rows), batch_size)]
+
+    def _build_sql_changes(self, changed_ids: dict, inserted_ids: dict) -> list | None:
+        """
+        Builds INSERT/UPDATE statements for the changed records only.
+        The IDs of newly inserted records are collected in inserted_ids ({table_name: set of IDs}),
+        to be added to the exported IDs once the statements are written.
+        Returns None if a full export is needed (a table has not been created in the SQL file yet).
+        """
         sql_statements = []
+        for table_name in self._export_sources():
+            records = self._get_table_records(table_name, changed_ids[table_name])
+            if not records:
+                continue
+            if table_name not in self._sql_tables:
+                return None
 
-        # Mapping Python types to SQL Server types (simplified)
-        type_mapping = {
-            int: "INT",
-            str: "NVARCHAR(255)", # NVARCHAR for string flexibility
-            bool: "BIT",
-            float: "FLOAT",
-            dict: "NVARCHAR(MAX)", # Store dicts as JSON strings
-            list: "NVARCHAR(MAX)" # Store lists as JSON strings
-        }
+            sanitized_table_name = f"tbl_{table_name.rstrip('s')}"
+            record_keys, formatters, exported_ids = self._sql_tables[table_name]
+            column_list = ", ".join(f"[{k}]" for k in record_keys)
+            insert_rows = []
+            for record in records:
+                values = [fmt(record.get(key)) for fmt, key in zip(formatters, record_keys)]
+                if record["id"] in exported_ids:
+                    assignments = ", ".join(f"[{key}] = {value}" for key, value in zip(record_keys, values) if key != "id")
+                    sql_statements.append(f"UPDATE [{sanitized_table_name}] SET {assignments} WHERE [id] = {record['id']};\n")
+                else:
+                    insert_rows.append("(" + ", ".join(values) + ")")
+                    inserted_ids.setdefault(table_name, set()).add(record["id"])
+            sql_statements.extend(self._sql_insert_batches(f"INSERT INTO [{sanitized_table_name}] ({column_list}) VALUES\n    ", insert_rows))
+
+        if sql_statements:
+            sql_statements.append("\nGO\n\n") # Separator for SSMS batches
+        return sql_statements
+
+    def export_to_sql(self, filename="eduplatform_data.sql", changed_ids: dict = None, data_to_export: dict = None) -> bool:
+        """
+        Generates SQL CREATE TABLE and INSERT INTO statements for SSMS.
+        If changed_ids ({table_name: set of IDs}) is given and the tables were already exported,
+        only INSERT/UPDATE statements for those records are appended to the existing file.
+        data_to_export is an already collected snapshot used for a full export.
+        Returns True if the SQL file was written (or had nothing to append), False if the export failed.
+        """
+        output_file = os.path.join(self.EXPORT_SQL_DIR, filename)
+
+        if changed_ids is not None and self._sql_tables:
+            inserted_ids = {}
+            sql_statements = self._build_sql_changes(changed_ids, inserted_ids)
+            if sql_statements is not None:
+                if not sql_statements:
+                    return True # No record changed since the last export, nothing to append
+                try:
+                    with open(output_file, 'a', encoding='utf-8', buffering=self.EXPORT_BUFFER_SIZE) as f:
+                        f.writelines(sql_statements)
+                    for table_name, ids in inserted_ids.items():
+                        self._sql_tables[table_name][2].update(ids) # Later changes to them are UPDATEs
+                    print(f"SQL statements for changed data appended to {output_file}.")
+                    self._log_export_event("sql", output_file)
+                    return True
+                except Exception as e:
+                    print(f"Error exporting to SQL: {e}")
+                    traceback.print_exc()
+                    return False
+
+        if data_to_export is None:
+            data_to_export = self._get_data_for_export()
+
+        sql_statements = ["-- SQL Export for EduPlatform Data\n\n"]
+        sql_tables = {}
 
         for table_name, records in data_to_export.items():
             sanitized_table_name = f"tbl_{table_name.rstrip('s')}" # e.g., users -> tbl_user, assignments -> tbl_assignment
@@ -468,20 +906,23 @@ class EduPlatform:
 
             # Generate CREATE TABLE statement
             columns = []
+            formatters = [] # One value formatter per column, chosen once from the inferred type
             record_keys = list(records[0].keys()) # Use keys from first record for column names
+
+            # Infer each column's type from its first non-None value, in one pass over the records
+            # that stops as soon as every column is resolved (usually after the first record)
+            col_types = dict.fromkeys(record_keys, "NVARCHAR(MAX)") # Default if type cannot be inferred
+            unresolved = set(record_keys)
+            for rec in records:
+                for key in [key for key in unresolved if rec.get(key) is not None]:
+                    col_types[key] = self._infer_sql_type(rec[key])
+                    unresolved.discard(key)
+                if not unresolved:
+                    break
+
             for key in record_keys:
-                sample_value = records[0].get(key)
-                # Handle potential None values or empty records in a robust way
-                if sample_value is None and len(records) > 1:
-                    # Try to find a non-None sample for type inference
-                    for rec in records:
-                        if rec.get(key) is not None:
-                            sample_value = rec.get(key)
-                            break
-
-                col_type = "NVARCHAR(MAX)" # Default to NVARCHAR(MAX) if type cannot be inferred
-                if sample_value is not None:
-                    col_type = type_mapping.get(type(sample_value), "NVARCHAR(MAX)")
+                col_type = col_types[key]
+                formatters.append(self._sql_formatter(col_type))
                 
                 # Add PRIMARY KEY for 'id' column
                 if key == 'id':
@@ -492,49 +933,92 @@ class EduPlatform:
             create_table_sql = f"CREATE TABLE [{sanitized_table_name}] (\n    " + ",\n    ".join(columns) + "\n);\n"
             sql_statements.append(create_table_sql)
 
-            # Generate INSERT INTO statements
-            for record in records:
-                # Prepare values for SQL (handle None, strings, and complex types)
-                values = []
-                for key in record_keys: # Ensure consistent order of values
-                    value = record.get(key)
-                    if value is None:
-                        values.append("NULL")
-                    elif isinstance(value, (int, float)):
-                        values.append(str(value))
-                    elif isinstance(value, (dict, list)):
-                        # Convert dict/list to JSON string for NVARCHAR(MAX)
-                        import json
-                        values.append(f"N'{json.dumps(value)}'")
-                    else: # Assume string
-                        # Escape single quotes within strings
-                        escaped_value = str(value).replace("'", "''")
-                        values.append(f"N'{escaped_value}'")
-                
-                insert_into_sql = f"INSERT INTO [{sanitized_table_name}] ({', '.join([f'[{k}]' for k in record_keys])}) VALUES ({', '.join(values)});\n"
-                sql_statements.append(insert_into_sql)
+            # Generate multi-row INSERT INTO statements
+            column_list = ", ".join(f"[{k}]" for k in record_keys) # Built once per table
+            insert_rows = [
+                # Prepare values for SQL in a consistent column order
+                "(" + ", ".join([fmt(record.get(key)) for fmt, key in zip(formatters, record_keys)]) + ")"
+                for record in records
+            ]
+            sql_statements.extend(self._sql_insert_batches(f"INSERT INTO [{sanitized_table_name}] ({column_list}) VALUES\n    ", insert_rows))
             
             sql_statements.append("\nGO\n\n") # Separator for SSMS batches
+            sql_tables[table_name] = (record_keys, formatters, {record["id"] for record in records})
 
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.writelines(sql_statements)
-            print(f"SQL statements successfully exported to {filename}.")
-            self.export_log.append(f"[{datetime.datetime.now().isoformat()}] Exported to SQL: {filename}")
+            # Write the whole script in one go to a temporary file and swap it in, so a failed
+            # export never leaves a truncated SQL file behind
+            temp_file = output_file + ".tmp"
+            with open(temp_file, 'w', encoding='utf-8', buffering=self.EXPORT_BUFFER_SIZE) as f:
+                f.write("".join(sql_statements))
+                self._release_page_cache(f)
+            os.replace(temp_file, output_file)
+            self._sql_tables = sql_tables
+            print(f"SQL statements successfully exported to {output_file}.")
+            self._log_export_event("sql", output_file)
+            return True
         except Exception as e:
             print(f"Error exporting to SQL: {e}")
+            traceback.print_exc()
+            return False
 
     def export_data_on_change(self):
         """
-        Automatically exports data to XLSX, CSV, and SQL whenever a significant change occurs.
-        This simple version exports all data every time.
-        Optimization for "only new/changed data" would require tracking changes per object.
+        Marks the data as changed so it gets exported to XLSX, CSV, and SQL.
+        With auto-export enabled the export runs on the background worker, so a burst of
+        changes results in a single export instead of one per change; otherwise the changes
+        wait for the next flush_exports().
         """
-        print("\n--- Auto-exporting data due to change ---")
-        self.export_to_xlsx()
-        self.export_to_csv()
-        self.export_to_sql()
-        print("--- Auto-export complete ---\n")
+        self._dirty.set()
+
+    def _export_all(self):
+        """
+        Exports all data to XLSX, CSV, and SQL. Must be called with the export lock held.
+        CSV and SQL only write the records whose content changed since the previous export.
+        The three exporters write independent files, so they run in parallel on one shared snapshot.
+        If the CSV or SQL export fails, the changed IDs are handed back, so their rows are written
+        by the next export instead of being lost.
+        """
+        print("\n--- Exporting changed data ---")
+        dirty_ids = self._take_dirty_ids()
+        exported = False
+        try:
+            changed_ids, new_hashes = self._drop_unchanged_ids(dirty_ids)
+            data_to_export = self._get_data_for_export()
+            with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+                futures = [
+                    executor.submit(self.export_to_xlsx, data_to_export=data_to_export),
+                    executor.submit(self.export_to_csv, changed_ids=changed_ids, data_to_export=data_to_export),
+                    executor.submit(self.export_to_sql, changed_ids=changed_ids, data_to_export=data_to_export)
+                ]
+                results = [future.result() for future in futures] # Re-raises any error not handled by the exporter itself
+            exported = results[1] and results[2] # CSV and SQL both written
+            if exported:
+                self._store_row_hashes(new_hashes)
+        except Exception as e:
+            print(f"Error during export: {e}")
+            traceback.print_exc()
+        if not exported:
+            self._restore_dirty_ids(dirty_ids)
+        print("--- Export complete ---\n")
+
+    def _export_worker(self):
+        """Background loop that waits for changes and exports them after a short debounce window."""
+        while True:
+            self._dirty.wait()
+            time.sleep(self.EXPORT_DEBOUNCE_SECONDS) # Let a burst of changes settle
+            with self._export_lock:
+                if not self._dirty.is_set():
+                    continue # Already exported by flush_exports()
+                self._dirty.clear()
+                self._export_all()
+
+    def flush_exports(self):
+        """Exports any pending changes immediately, e.g. after a bulk import or before the program exits."""
+        with self._export_lock:
+            if self._dirty.is_set():
+                self._dirty.clear()
+                self._export_all()
 
     def view_export_log(self):
         """Displays the log of export operations."""
@@ -542,112 +1026,5 @@ class EduPlatform:
         if not self.export_log:
             print("No export operations logged yet.")
         for log_entry in self.export_log:
-            print(log_entry)
+            print(self._format_log_entry(log_entry))
         print("------------------")
-
-    def _log_export_event(self, export_type: str, file_name: str):
-        """Logs an export event with a timestamp."""
-        timestamp = datetime.datetime.now().isoformat()
-        self.export_log.append({
-            "timestamp": timestamp,
-            "type": export_type,
-            "file_name": file_name
-        })
-        # print(f"Logged export event: Type='{export_type}', File='{file_name}'") # For debugging
-
-    # ... (rest of your export_to_csv, export_to_xlsx, export_to_sql methods) ...
-
-    # Example call from export_to_csv, ensure this method exists:
-    
-    def export_to_xlsx(self):
-        try:
-            workbook = openpyxl.Workbook()
-
-            # ... (your existing XLSX export logic for sheets) ...
-
-            # Change this line:
-            # output_file = "eduplatform_data.xlsx"
-            # To this:
-            output_file = os.path.join(self.EXPORT_XLSX_DIR, "eduplatform_data.xlsx")
-
-            workbook.save(output_file)
-            print(f"Data successfully exported to {output_file} (XLSX).")
-            self._log_export_event("xlsx", output_file) # Log the path used
-
-        except Exception as e:
-            print(f"Error exporting to XLSX: {e}")
-            import traceback
-            traceback.print_exc()
-
-
-    def export_to_csv(self):
-        try:
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-
-            # --- Users CSV Export ---
-            users_data = [user.get_profile() for user in self.users.values()]
-            # Change this line:
-            # users_file_name = f"eduplatform_data_users_{timestamp}.csv"
-            # To this:
-            users_file_name = os.path.join(self.EXPORT_CSV_DIR, f"eduplatform_data_users_{timestamp}.csv")
-            
-            # ... (rest of users export logic) ...
-
-            # --- Assignments CSV Export ---
-            assignments_data = [assign.get_assignment_info() for assign in self.assignments.values()]
-            # Change this line:
-            # assignments_file_name = f"eduplatform_data_assignments_{timestamp}.csv"
-            # To this:
-            assignments_file_name = os.path.join(self.EXPORT_CSV_DIR, f"eduplatform_data_assignments_{timestamp}.csv")
-            
-            # ... (rest of assignments export logic) ...
-
-            # --- Grades CSV Export ---
-            grades_data = [grade.get_grade_info() for grade in self.grades.values()]
-            # Change this line:
-            # grades_file_name = f"eduplatform_data_grades_{timestamp}.csv"
-            # To this:
-            grades_file_name = os.path.join(self.EXPORT_CSV_DIR, f"eduplatform_data_grades_{timestamp}.csv")
-            
-            # ... (rest of grades export logic) ...
-
-            # --- Schedules CSV Export ---
-            schedules_data = [schedule.get_schedule_info() for schedule in self.schedules.values()]
-            # Change this line:
-            # schedules_file_name = f"eduplatform_data_schedules_{timestamp}.csv"
-            # To this:
-            schedules_file_name = os.path.join(self.EXPORT_CSV_DIR, f"eduplatform_data_schedules_{timestamp}.csv")
-            
-            # ... (rest of schedules export logic) ...
-
-            # Adjust the _log_export_event message to reflect the new paths
-            self._log_export_event("csv", f"{self.EXPORT_CSV_DIR}/users_{timestamp}.csv, {self.EXPORT_CSV_DIR}/assignments_{timestamp}.csv, {self.EXPORT_CSV_DIR}/grades_{timestamp}.csv, {self.EXPORT_CSV_DIR}/schedules_{timestamp}.csv")
-            print("--- Auto-export complete ---")
-
-        except Exception as e:
-            print(f"Error exporting to CSV: {e}")
-            import traceback
-            traceback.print_exc()
-
-
-
-
-    def export_to_sql(self):
-        # Change this line:
-        # output_file = "eduplatform_data.sql"
-        # To this:
-        output_file = os.path.join(self.EXPORT_SQL_DIR, "eduplatform_data.sql")
-        
-        try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write("-- SQL Export for EduPlatform Data\n\n")
-
-                # ... (your existing SQL generation logic) ...
-
-            print(f"SQL statements successfully exported to {output_file}.")
-            self._log_export_event("sql", output_file) # Log the path used
-
-        except Exception as e:
-            print(f"Error exporting to SQL: {e}")
-            import traceback
-            traceback.print_exc()
\ No newline at end of file
@@ -1,45 +1,71 @@
 import datetime
+import itertools
+import logging
+from core.serialization import json_dumps
+
+logger = logging.getLogger(__name__)
+
+# Canonical priority strings, so the common priorities share one string object instead of a new .lower() copy each
+_PRIORITIES = {"normal": "normal", "important": "important", "urgent": "urgent",
+               "Normal": "normal", "Important": "important", "Urgent": "urgent"}
+
+# Notifications kept per user; older ones are dropped first, so a user's inbox can't grow without bound over a term
+MAX_NOTIFICATIONS = 200
 
 class Notification:
     """
     Represents a notification in the EduPlatform.
     Notifications can be sent to any user. 
     """
-    _next_id = 1 # Class-level attribute to generate unique IDs for notifications
+    _id_counter = itertools.count(1) # Class-level counter generating unique IDs for notifications (atomic next())
+    __slots__ = ('_id', 'message', 'recipient_id', 'created_at', '_is_read', 'priority', '_info_json') # No per-instance __dict__
 
-    def __init__(self, message: str, recipient_id: int, priority: str = "normal"):
+    def __init__(self, message: str, recipient_id: int, priority: str = "normal", created_at: str = None):
         """
         Initializes a Notification instance.
         Attributes:
         id: Notification ID (int) 
         message: Message text (str) 
         recipient_id: Recipient ID (int) 
-        created_at: Creation date (str) 
+        created_at: Creation date (str), defaults to now; callers sending a batch pass one shared timestamp
         is_read: Status indicating if the notification has been read (bool)
         priority: Priority of the notification (str, e.g., "normal", "important") 
         """
-        self._id = Notification._next_id
-        Notification._next_id += 1
+        self._id = next(Notification._id_counter)
         self.message = message
         self.recipient_id = recipient_id
-        self.created_at = datetime.datetime.now().isoformat()
-        self.is_read = False # Default to unread
-        self.priority = priority.lower() # Store priority in lowercase for consistency 
+        self.created_at = created_at or datetime.datetime.now().isoformat()
+        self._is_read = False # Default to unread
+        # Store priority in lowercase for consistency
+        self.priority = _PRIORITIES.get(priority) or _PRIORITIES.get(priority.lower(), priority.lower())
+        self._info_json = None # Cached JSON of get_notification_info(); only is_read changes after creation
 
     @property
     def id(self) -> int:
         return self._id
 
+    @property
+    def is_read(self) -> bool:
+        return self._is_read
+
+    @is_read.setter
+    def is_read(self, value: bool):
+        self._is_read = value
+        self._info_json = None
+
     def send(self):
         """
         Simulates sending a notification.
         In a real system, this would involve pushing to a UI or external service.
-        For now, it prints a message.
+        For now, it logs a message (the text is only formatted when the buffered log is written).
         """
-        print(f"Notification {self.id} sent to user {self.recipient_id}: '{self.message}'")
+        logger.info("Notification %d sent to user %d: '%s'", self.id, self.recipient_id, self.message)
 
     def mark_as_read(self):
-        """Marks the notification as read. """
+        """
+        Marks the notification as read.
+        Use User.mark_notification_read, which also refreshes the recipient's cached profile.
+        """
         self.is_read = True
 
     def get_notification_info(self) -> dict:
@@ -51,4 +77,10 @@ class Notification:
             "created_at": self.created_at,
             "is_read": self.is_read,
             "priority": self.priority
-        }
\ No newline at end of file
+        }
+
+    def get_notification_json(self) -> str:
+        """Returns get_notification_info() as a JSON string, serialized once until the notification is read."""
+        if self._info_json is None:
+            self._info_json = json_dumps(self.get_notification_info())
+        return self._info_json
\ No newline at end of file
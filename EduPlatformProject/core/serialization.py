@@ -0,0 +1,22 @@
+import json
+
+# Every JSON field of the exports goes through these helpers, so they all share one compact style.
+# Without orjson, the standard library is set up to produce the same text (no spaces, UTF-8 kept as is),
+# so the exported files don't depend on whether the optional package is installed.
+try:
+    import orjson # Optional: C-accelerated JSON encoder, used for the export JSON when installed
+except ImportError:
+    orjson = None
+
+def json_dumps_bytes(value) -> bytes:
+    """Encodes a value as UTF-8 JSON bytes, using orjson when it is available."""
+    if orjson is not None:
+        # Submissions, grades and assignment statuses are keyed by int IDs, which orjson only accepts with this option
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+def json_dumps(value) -> str:
+    """Encodes a value as a JSON string, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False)
@@ -1,6 +1,8 @@
 from EduPlatform.edu_platform import EduPlatform
 from core.enums import UserRole, AssignmentDifficulty
 import datetime # Just for example date input
+import logging
+import sys
 
 def run_edu_platform():
     platform = EduPlatform()
@@ -30,7 +32,7 @@ def run_edu_platform():
     
     if teacher1:
         teacher1.update_profile(subjects=["Math", "Physics"], classes=["9-A", "10-B"])
-        print(f"Teacher {teacher1.full_name} subjects: {teacher1.subjects}")
+        print(f"Teacher {teacher1.full_name} subjects: {sorted(teacher1.subjects)}")
 
     # In main.py, locate the section where "Late Homework" is created:
 
@@ -106,7 +108,7 @@ def run_edu_platform():
         print(f"Average grade for {student1.full_name}: {student1.calculate_average_grade()}")
 
     if parent1 and student1:
-        print(f"\n{parent1.full_name}'s view of {student1.full_name}'s grades: {parent1.view_child_grades(student1.id, platform.users)}")
+        print(f"\n{parent1.full_name}'s view of {student1.full_name}'s grades: {parent1.view_child_grades(student1.id)}")
         print(f"{parent1.full_name}'s notifications: {parent1.view_notifications()}")
     
     # --- 8. Schedule Management ---
@@ -115,7 +117,8 @@ def run_edu_platform():
     if schedule9A_mon:
         platform.add_lesson_to_schedule(schedule9A_mon.id, "09:00", "Math", teacher1.id)
         platform.add_lesson_to_schedule(schedule9A_mon.id, "10:00", "Physics", teacher1.id)
-        print(f"Schedule for {schedule9A_mon.class_id} on {schedule9A_mon.day}: {schedule9A_mon.view_schedule()['lessons']}")
+        lessons = {time: dict(lesson) for time, lesson in schedule9A_mon.view_schedule()['lessons'].items()} # Read-only views, as plain dicts
+        print(f"Schedule for {schedule9A_mon.class_id} on {schedule9A_mon.day}: {lessons}")
         
         # Try adding lesson with conflicting teacher time
         platform.add_lesson_to_schedule(schedule9A_mon.id, "09:00", "Chemistry", teacher1.id) # Should fail due to conflict
@@ -132,8 +135,9 @@ def run_edu_platform():
         for student_name, data in list(student_report.get("student_success", {}).items())[:2]:
             print(f"- {student_name}: Avg Grade {data['average_overall_grade']:.2f}")
 
-    # --- 10. Manual Export (already happens automatically on change) ---
+    # --- 10. Manual Export (automatic export on change is off by default) ---
     print("\n--- Manual Export Check ---")
+    platform.flush_exports() # Write out all changes made above in one export
     # platform.export_to_xlsx("final_eduplatform_data.xlsx")
     # platform.export_to_csv("final_eduplatform_data")
     # platform.export_to_sql("final_eduplatform_data.sql")
@@ -146,4 +150,6 @@ def run_edu_platform():
 
 
 if __name__ == "__main__":
+    # The models report through loggers; show their messages on stdout, in order with the prints
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     run_edu_platform()
\ No newline at end of file
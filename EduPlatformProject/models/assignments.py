@@ -1,23 +1,40 @@
 # models/assignments.py
-import json
 import datetime
+import itertools
+import logging
+import re
+import sys
 from core.enums import AssignmentDifficulty, AssignmentStatus # Assuming these are defined here
+from core.serialization import json_dumps
+
+logger = logging.getLogger(__name__)
+
+# Longest accepted submission content, checked before a submission touches any other state
+MAX_SUBMISSION_CHARS = 500
+
+# Fast path for deadlines starting with YYYY-MM-DD (plain dates and ISO datetimes), avoiding strptime
+_DATE_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})(?:[T ]|$)')
 
 class Assignment:
-    _next_id = 1
+    _id_counter = itertools.count(1) # Class-level counter generating unique assignment IDs (atomic next())
+    __slots__ = ('_id', '_teacher_id', '_title', '_description', '_deadline', '_deadline_invalid', '_subject',
+                 '_class_id', '_difficulty', '_submissions', '_grades', '_late_ids', '_info_cache', '_status') # No per-instance __dict__
 
     def __init__(self, teacher_id: int, title: str, description: str, deadline: str, # deadline received as string
                  subject: str, class_id: str, difficulty: AssignmentDifficulty):
-        self._id = Assignment._next_id
-        Assignment._next_id += 1
+        self._id = next(Assignment._id_counter)
         self._teacher_id = teacher_id
         self._title = title
         self._description = description
+        self._deadline_invalid = False # True if the given deadline could not be parsed
         
         # --- CRITICAL FIX: ROBUST DEADLINE PARSING ---
-        # Attempt to parse as date first (YYYY-MM-DD)
+        # Attempt to parse as date first (YYYY-MM-DD, optionally followed by a time)
         try:
-            self._deadline = datetime.datetime.strptime(deadline, "%Y-%m-%d").date()
+            match = _DATE_RE.match(deadline)
+            if not match:
+                raise ValueError(deadline)
+            self._deadline = datetime.date(int(match[1]), int(match[2]), int(match[3]))
         except ValueError:
             # If that fails, try to parse as a full ISO datetime string (YYYY-MM-DDTHH:MM:SS.ffffff)
             # and then extract just the date part. This handles what datetime.datetime.now().isoformat() produces.
@@ -26,16 +43,21 @@ class Assignment:
                 # Optionally, add a less severe warning here if you want to know it had a time component
                 # print(f"Note: Deadline '{deadline}' had time component, but was successfully converted to date.")
             except ValueError:
-                # If both parsing attempts fail, store it as a string and print an error.
-                # This should ideally not happen if you pass valid date/datetime strings.
-                self._deadline = deadline # Fallback to string, but this is problematic for comparisons
-                print(f"ERROR: Invalid deadline format '{deadline}'. Storing as string, which may cause errors later.")
+                # If both parsing attempts fail, fall back to the earliest date and flag it, so the
+                # deadline is always a datetime.date and never needs re-parsing when read.
+                self._deadline = datetime.date.min
+                self._deadline_invalid = True
+                print(f"ERROR: Invalid deadline format '{deadline}'. Using {self._deadline} instead.")
         
-        self._subject = subject
-        self._class_id = class_id
+        self._subject = sys.intern(subject) # Interned: compared against teacher subjects on every grade
+        self._class_id = sys.intern(class_id) # Interned: looked up in the platform's students-by-class index
         self._difficulty = difficulty
+        # Keyed by the global student ID: a class only submits a few dozen entries, lookups are O(1),
+        # and the exports serialize these dicts as-is
         self._submissions = {} # {student_id: {"content": str, "timestamp": str, "is_late": bool}}
         self._grades = {}      # {student_id: int}
+        self._late_ids = set() # IDs of the students whose current submission is late
+        self._info_cache = None # Cached get_assignment_info() record; reset whenever submissions, grades or status change
         self._status = AssignmentStatus.PENDING # Initial status
 
     # --- Properties and Methods (rest of your Assignment class) ---
@@ -58,20 +80,13 @@ class Assignment:
 
     @property
     def deadline(self) -> datetime.date: # <--- THIS MUST RETURN A datetime.date OBJECT
-        """Returns the deadline as a datetime.date object."""
-        # Ensure it's a date object if for some reason it's still a string (due to prior error)
-        if isinstance(self._deadline, str):
-            # This block should ideally not be hit if the __init__ parsing is robust.
-            # But as a fallback, try to convert it here too.
-            try:
-                return datetime.datetime.fromisoformat(self._deadline).date()
-            except ValueError:
-                # If even this fails, raise an error or return a default/None
-                print(f"Critical Error: Assignment {self.id} deadline '{self._deadline}' could not be parsed as date.")
-                # Decide how to handle: raise, return None, or a default date
-                return datetime.date.min # Or raise ValueError("Invalid deadline format")
+        """Returns the deadline as a datetime.date object (datetime.date.min if it was invalid)."""
         return self._deadline
 
+    @property
+    def deadline_invalid(self) -> bool:
+        return self._deadline_invalid
+
     @property
     def subject(self) -> str:
         return self._subject
@@ -96,30 +111,65 @@ class Assignment:
     def grades(self) -> dict:
         return self._grades
 
-    def add_submission(self, student_id: int, content: str, is_late: bool = False):
-        timestamp = datetime.datetime.now().isoformat()
+    def add_submission(self, student_id: int, content: str, is_late: bool = False, timestamp: str = None):
+        timestamp = timestamp or datetime.datetime.now().isoformat()
         self._submissions[student_id] = {
             "content": content,
             "timestamp": timestamp,
             "is_late": is_late
         }
+        self._info_cache = None
         if is_late:
+            self._late_ids.add(student_id)
             self._status = AssignmentStatus.LATE_SUBMISSION
         else:
+            self._late_ids.discard(student_id)
             self._status = AssignmentStatus.SUBMITTED # Status for the assignment as a whole
 
     def set_grade(self, student_id: int, grade_value: int):
         if student_id in self._submissions:
             self._grades[student_id] = grade_value
+            self._info_cache = None
             self._status = AssignmentStatus.GRADED # Update assignment status
-            print(f"Grade {grade_value} set for student {student_id} on assignment {self.id}.")
+            logger.info("Grade %s set for student %s on assignment %s.", grade_value, student_id, self.id)
         else:
-            print(f"Error: Student {student_id} has no submission for assignment {self.id}.")
+            logger.warning("Error: Student %s has no submission for assignment %s.", student_id, self.id)
+
+    def remove_student(self, student_id: int):
+        """Removes a student's submission and grade, e.g. when the student is removed from the platform."""
+        self._submissions.pop(student_id, None)
+        self._grades.pop(student_id, None)
+        self._late_ids.discard(student_id)
+        self._info_cache = None
+
+    def get_submission_status(self, student_id: int) -> AssignmentStatus:
+        """
+        Returns one student's status on this assignment (graded, late, submitted or pending),
+        from membership tests only, without reading the submission record.
+        """
+        if student_id in self._grades:
+            return AssignmentStatus.GRADED
+        if student_id in self._late_ids:
+            return AssignmentStatus.LATE_SUBMISSION
+        if student_id in self._submissions:
+            return AssignmentStatus.SUBMITTED
+        return AssignmentStatus.PENDING
 
     def get_assignment_info(self) -> dict:
-        """Returns a dictionary with assignment details for export."""
-        # Ensure deadline is formatted as a string for export if it's a date object
-        deadline_str = self.deadline.isoformat() if isinstance(self.deadline, datetime.date) else str(self.deadline)
+        """
+        Returns a dictionary with assignment details for export.
+        The record (with its serialized submissions and grades) is only rebuilt after the
+        assignment changed; otherwise a copy of the cached one is returned.
+        """
+        if self._info_cache is None:
+            self._info_cache = self._build_assignment_info()
+        return dict(self._info_cache)
+
+    def _build_assignment_info(self) -> dict:
+        """Builds the export record returned by get_assignment_info."""
+        submissions_json = json_dumps(self._submissions)
+        grades_json = json_dumps(self._grades)
+        deadline_str = self._deadline.isoformat() # Always a datetime.date, see __init__
 
         return {
             "id": self.id,
@@ -131,6 +181,6 @@ class Assignment:
             "class_id": self.class_id,
             "difficulty": self.difficulty.value,
             "status": self.status.value,
-            "submissions": json.dumps(self.submissions), # Serialize complex types for export
-            "grades": json.dumps(self.grades)            # Serialize complex types for export
+            "submissions": submissions_json, # Serialized complex types for export
+            "grades": grades_json            # Serialized complex types for export
         }
\ No newline at end of file
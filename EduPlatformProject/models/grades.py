@@ -1,13 +1,21 @@
 from __future__ import annotations
 import datetime
+import itertools
+import logging
+import sys
+
+logger = logging.getLogger(__name__)
+
+VALID_GRADES = frozenset((1, 2, 3, 4, 5)) # Accepted grade values, checked with one membership test
 
 class Grade:
     """
     Represents a specific grade given to a student for a subject.
     """
-    _next_id = 1 # Class-level attribute to generate unique IDs for grades
+    _id_counter = itertools.count(1) # Class-level counter generating unique grade IDs (atomic next())
+    __slots__ = ('_id', 'student_id', 'subject', 'value', 'date', 'teacher_id', 'comment') # No per-instance __dict__
 
-    def __init__(self, student_id: int, subject: str, value: int, teacher_id: int, comment: str = None):
+    def __init__(self, student_id: int, subject: str, value: int, teacher_id: int, comment: str = None, date: str = None):
         """
         Initializes a Grade instance.
         Attributes:
@@ -15,16 +23,15 @@ class Grade:
         student_id: ID of the student who received the grade (int)
         subject: Subject the grade is for (str)
         value: Grade value (int, 1-5)
-        date: Date the grade was given (str, ISO format)
+        date: Date the grade was given (str, ISO format), defaults to now; callers grading a batch pass one shared timestamp
         teacher_id: ID of the teacher who gave the grade (int)
         comment: Optional comment for the grade (str)
         """
-        self._id = Grade._next_id
-        Grade._next_id += 1
+        self._id = next(Grade._id_counter)
         self.student_id = student_id
-        self.subject = subject
+        self.subject = sys.intern(subject) # Shared with the assignment's (interned) subject
         self.value = value
-        self.date = datetime.datetime.now().isoformat()
+        self.date = date or datetime.datetime.now().isoformat()
         self.teacher_id = teacher_id
         self.comment = comment
 
@@ -36,13 +43,13 @@ class Grade:
         """
         Updates the value and/or comment of the grade.
         """
-        if not (1 <= new_value <= 5):
-            print("Error: New grade value must be between 1 and 5.")
+        if new_value not in VALID_GRADES:
+            logger.warning("Error: New grade value must be between 1 and 5.")
             return False
         self.value = new_value
         if new_comment is not None:
             self.comment = new_comment
-        print(f"Grade {self.id} updated to {self.value} for student {self.student_id} in {self.subject}.")
+        logger.info("Grade %s updated to %s for student %s in %s.", self.id, self.value, self.student_id, self.subject)
         return True
 
     def get_grade_info(self) -> dict:
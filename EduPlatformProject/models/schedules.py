@@ -1,11 +1,32 @@
 from __future__ import annotations
-import datetime
+import bisect
+import functools
+import itertools
+import re
+import sys
+import types
+from core.serialization import json_dumps
+
+_HHMM_RE = re.compile(r'([01]?\d|2[0-3]):([0-5]?\d)') # Same times strptime accepts for "%H:%M"
+
+@functools.lru_cache(maxsize=1440)
+def lesson_minute(time: str) -> int | None:
+    """
+    Returns the minute of the day of an "HH:MM" lesson time, or None if the time is invalid.
+    Lesson times come from a small set ("09:00", "10:00", ...), so results are cached per string.
+    """
+    match = _HHMM_RE.fullmatch(time)
+    if match is None:
+        return None
+    return int(match[1]) * 60 + int(match[2])
 
 class Schedule:
     """
     Represents a class schedule for a specific class/group on a given day.
     """
-    _next_id = 1 # Class-level attribute to generate unique IDs for schedules
+    _id_counter = itertools.count(1) # Class-level counter generating unique IDs for schedules (atomic next())
+    __slots__ = ('_id', 'class_id', 'day', '_times', '_subjects', '_teacher_ids',
+                 '_lessons_view', '_lessons_proxy', '_lessons_json', '_schedule_view') # No per-instance __dict__
 
     def __init__(self, class_id: str, day: str):
         """
@@ -14,19 +35,63 @@ class Schedule:
         id: Unique schedule ID (int)
         class_id: The ID of the class/group this schedule is for (str)
         day: Day of the week (e.g., "Monday", "Tuesday") (str)
-        lessons: Dictionary of lessons for the day ({time: {'subject': str, 'teacher_id': int}})
+        lessons: Dictionary of lessons for the day ({time: {'subject': str, 'teacher_id': int}}), read-only
         """
-        self._id = Schedule._next_id
-        Schedule._next_id += 1
-        self.class_id = class_id
-        self.day = day
-        # Lessons: { "09:00": {"subject": "Math", "teacher_id": 1}, "10:00": {...} }
-        self.lessons = {}
+        self._id = next(Schedule._id_counter)
+        self.class_id = sys.intern(class_id) # Class IDs and subjects are a few dozen strings shared platform-wide
+        self.day = sys.intern(day) # Seven distinct values across all schedules
+        # Lessons are kept as parallel lists sorted by start time (minutes since midnight), so finding
+        # a lesson or a conflict is a binary search and the day always reads in time order.
+        # Change them through add_lesson/remove_lesson, which reset the cached views below.
+        self._times = []       # [start minute]
+        self._subjects = []    # [subject], parallel to _times
+        self._teacher_ids = [] # [teacher_id], parallel to _times
+        self._lessons_view = None  # Cached {"HH:MM": {"subject": str, "teacher_id": int}}, serialized for export
+        self._lessons_proxy = None # Cached read-only view of _lessons_view (lessons included) behind the lessons property
+        self._lessons_json = None  # Cached JSON of lessons for get_schedule_info
+        self._schedule_view = None # Cached read-only view_schedule result
 
     @property
     def id(self) -> int:
         return self._id
 
+    @property
+    def lessons(self) -> types.MappingProxyType:
+        """
+        Returns the lessons as { "09:00": {"subject": "Math", "teacher_id": 1}, "10:00": {...} },
+        in time order, as a read-only mapping whose lessons are read-only mappings too
+        (the views are shared, so no caller may change them). Built once per change.
+        """
+        if self._lessons_proxy is None:
+            self._lessons_proxy = types.MappingProxyType({
+                time: types.MappingProxyType(lesson) for time, lesson in self._lessons_dict().items()
+            })
+        return self._lessons_proxy
+
+    def _lessons_dict(self) -> dict:
+        """Returns the cached lessons dict, rebuilding it from the sorted lists after a change."""
+        if self._lessons_view is None:
+            self._lessons_view = {
+                f"{minute // 60:02d}:{minute % 60:02d}": {"subject": subject, "teacher_id": teacher_id}
+                for minute, subject, teacher_id in zip(self._times, self._subjects, self._teacher_ids)
+            }
+        return self._lessons_view
+
+    def _lesson_index(self, minute: int) -> int | None:
+        """Returns the position of the lesson starting at the given minute, or None if there is none."""
+        index = bisect.bisect_left(self._times, minute)
+        if index < len(self._times) and self._times[index] == minute:
+            return index
+        return None
+
+    def lesson_at(self, time: str) -> dict | None:
+        """Returns the lesson at an "HH:MM" time as {"subject": str, "teacher_id": int}, or None."""
+        minute = lesson_minute(time)
+        index = None if minute is None else self._lesson_index(minute)
+        if index is None:
+            return None
+        return {"subject": self._subjects[index], "teacher_id": self._teacher_ids[index]}
+
     def add_lesson(self, time: str, subject: str, teacher_id: int) -> bool:
         """
         Adds a lesson to the schedule for a specific time.
@@ -34,35 +99,70 @@ class Schedule:
         Time format: "HH:MM" (e.g., "09:00")
         """
         # Basic time format validation (can be more robust)
-        try:
-            datetime.datetime.strptime(time, "%H:%M").time()
-        except ValueError:
+        minute = lesson_minute(time)
+        if minute is None:
             print(f"Error: Invalid time format '{time}'. Use HH:MM (e.g., 09:00).")
             return False
 
-        if time in self.lessons:
+        index = bisect.bisect_left(self._times, minute)
+        if index < len(self._times) and self._times[index] == minute:
             print(f"Error: A lesson is already scheduled at {time} on {self.day} for class {self.class_id}.")
             return False
         
-        self.lessons[time] = {"subject": subject, "teacher_id": teacher_id}
+        self._times.insert(index, minute)
+        self._subjects.insert(index, sys.intern(subject))
+        self._teacher_ids.insert(index, teacher_id)
+        self._invalidate_views()
         print(f"Lesson '{subject}' added for {self.class_id} on {self.day} at {time}.")
         return True
 
-    def view_schedule(self) -> dict:
-        """Returns the daily schedule."""
+    def _invalidate_views(self):
+        """Drops the cached lesson views after the lessons changed."""
+        self._lessons_view = None
+        self._lessons_proxy = None
+        self._lessons_json = None
+        self._schedule_view = None
+
+    def view_schedule(self) -> types.MappingProxyType:
+        """
+        Returns the daily schedule as a read-only mapping.
+        The same view is returned until the lessons change.
+        """
+        if self._schedule_view is None:
+            self._schedule_view = types.MappingProxyType({
+                "schedule_id": self.id,
+                "class_id": self.class_id,
+                "day": self.day,
+                "lessons": self.lessons
+            })
+        return self._schedule_view
+
+    def get_schedule_info(self) -> dict:
+        """
+        Returns a dictionary with schedule details for export.
+        Converts the lessons dict to a JSON string for export compatibility,
+        serialized once until the lessons change.
+        """
+        if self._lessons_json is None:
+            self._lessons_json = json_dumps(self._lessons_dict())
         return {
-            "schedule_id": self.id,
+            "id": self.id,
             "class_id": self.class_id,
             "day": self.day,
-            "lessons": self.lessons
+            "lessons": self._lessons_json
         }
 
     def remove_lesson(self, time: str) -> bool:
         """
         Removes a lesson from the schedule at a specific time.
         """
-        if time in self.lessons:
-            del self.lessons[time]
+        minute = lesson_minute(time)
+        index = None if minute is None else self._lesson_index(minute)
+        if index is not None:
+            del self._times[index]
+            del self._subjects[index]
+            del self._teacher_ids[index]
+            self._invalidate_views()
             print(f"Lesson at {time} removed from schedule for {self.class_id} on {self.day}.")
             return True
         print(f"Error: No lesson found at {time} to remove.")
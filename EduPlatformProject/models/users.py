@@ -1,21 +1,40 @@
 from __future__ import annotations
 
+import concurrent.futures
 import hashlib
+import hmac
 import datetime
-import json  # <--- ADDED: Import for JSON serialization
+import itertools
+import os
+import sys
+import time
+import logging
 from abc import ABC, abstractmethod
 from core.enums import UserRole, AssignmentDifficulty, AssignmentStatus
-from core.notifications import Notification
-from models.assignments import Assignment  # Corrected import for Assignment model
-from models.grades import Grade            # Corrected import for Grade model
+from core.notifications import Notification, MAX_NOTIFICATIONS
+from core.serialization import json_dumps
+from models.assignments import Assignment, MAX_SUBMISSION_CHARS  # Corrected import for Assignment model
+from models.grades import VALID_GRADES
 from models.schedules import Schedule      # Corrected import for Schedule model
 
+logger = logging.getLogger(__name__)
+
+# Role names accepted by Admin.add_user (lowercase), mapped to their enum members once
+_ROLE_BY_NAME = {role.value.lower(): role for role in UserRole}
+
 class AbstractRole(ABC):
     """
     Abstract base class for all user roles in the EduPlatform.
     Defines common attributes and abstract methods that must be implemented by subclasses.
     """
-    _next_id = 1 # Class-level attribute to generate unique IDs for users
+    _id_counter = itertools.count(1) # Class-level counter generating unique IDs for users (atomic next())
+    # No per-instance __dict__ (ABC itself has empty __slots__); every subclass declares its own slots too
+    __slots__ = ('_id', '_full_name', '_email', '_password_hash', '_password_salt', '_password_cost', '_created_at_ts')
+    # scrypt cost parameters for password hashing (n: CPU/memory cost, r: block size, p: parallelism).
+    # They are stored with each hash, so raising them later doesn't break existing passwords.
+    SCRYPT_N = 2 ** 14
+    SCRYPT_R = 8
+    SCRYPT_P = 1
 
     def __init__(self, full_name: str, email: str, password: str):
         """
@@ -24,22 +43,38 @@ class AbstractRole(ABC):
         _id: Unique ID (int)
         _full_name: Full name (str)
         _email: Electronic mail (str)
-        _password_hash: Hashed password (str)
-        _created_at: Registration date (str, ISO format)
+        _password_hash: Hashed password (bytes, the raw 32-byte digest)
+        _password_salt: Random per-user salt of the password hash (bytes)
+        _password_cost: scrypt (n, r, p) the password hash was made with (tuple)
+        _created_at_ts: Registration time (float, seconds since the epoch); created_at formats it on read
         """
-        self._id = AbstractRole._next_id
-        AbstractRole._next_id += 1
+        self._id = next(AbstractRole._id_counter)
         self._full_name = full_name
         self._email = email
-        self._password_hash = self._hash_password(password) # Hash the password for security
-        self._created_at = datetime.datetime.now().isoformat() # Current timestamp in ISO format
+        self._set_password(password) # Hash the password for security
+        self._created_at_ts = time.time() # Formatted as ISO only when created_at is read
 
     @staticmethod
-    def _hash_password(password: str) -> str:
+    def _hash_password(password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
         """
-        Hashes the password using SHA256 for basic security.
+        Hashes the password with scrypt, a salted and deliberately slow, memory-hard function,
+        so every guess costs an attacker a bounded amount of work.
+        The raw digest is kept (no hex encoding), so authenticate compares 32 bytes, not 64 characters.
         """
-        return hashlib.sha256(password.encode()).hexdigest()
+        return hashlib.scrypt(password.encode('utf-8'), salt=salt, n=n, r=r, p=p, dklen=32)
+
+    def _set_password(self, password: str | None):
+        """
+        Stores a hash of the password with a fresh random salt and the current cost parameters.
+        None defers hashing: Admin.add_users_bulk creates the users first and then sets all
+        their passwords in parallel. Until then the account has no password and can't log in.
+        """
+        self._password_salt = os.urandom(16)
+        self._password_cost = (self.SCRYPT_N, self.SCRYPT_R, self.SCRYPT_P)
+        if password is None:
+            self._password_hash = None
+            return
+        self._password_hash = self._hash_password(password, self._password_salt, *self._password_cost)
 
     @property
     def id(self) -> int:
@@ -58,8 +93,8 @@ class AbstractRole(ABC):
 
     @property
     def created_at(self) -> str:
-        """Returns the creation timestamp of the user account."""
-        return self._created_at
+        """Returns the creation timestamp of the user account (str, ISO format, local time)."""
+        return datetime.datetime.fromtimestamp(self._created_at_ts).isoformat()
 
     @abstractmethod
     def get_profile(self) -> dict:
@@ -82,24 +117,54 @@ class User(AbstractRole):
     Base user class inheriting from AbstractRole.
     Adds common user functionalities like notifications and authentication.
     """
+    __slots__ = ('role', '_notifications', '_notifications_by_priority', 'phone', 'address', '_profile_cache', '_profile_dirty',
+                 '_change_listener')
+
     def __init__(self, full_name: str, email: str, password: str, role: UserRole):
         """
         Initializes a User instance.
         Attributes:
         role: User role (enum: Admin, Teacher, Student, Parent)
-        _notifications: List of notifications (list)
+        _notifications: Notifications by ID, in creation order (dict)
         phone: Additional profile information (str, optional)
         address: Additional profile information (str, optional)
+        _profile_cache: Last profile built by _build_profile (dict), reused while _profile_dirty is False
+        _change_listener: Called with the user after every change (callable, optional), see _invalidate_profile
         """
         super().__init__(full_name, email, password)
         self.role = role
-        self._notifications = [] # List to store Notification objects
+        self._notifications = {} # {notification_id: Notification}, in creation order
+        self._notifications_by_priority = {} # {priority: {notification_id: Notification}}, for filtered views
         self.phone = None # Additional profile information
         self.address = None # Additional profile information
+        self._profile_cache = None
+        self._profile_dirty = True # Set by every method that changes what get_profile returns
+        self._change_listener = None # Set by the platform that stores this user, so direct changes reach its indexes
+
+    def _invalidate_profile(self):
+        """
+        Marks the cached profile as stale, so the next get_profile call rebuilds it,
+        and tells the change listener (if any) that the user changed.
+        """
+        self._profile_dirty = True
+        if self._change_listener is not None:
+            self._change_listener(self)
 
     def get_profile(self) -> dict:
         """
         Returns the user's profile information, including role, phone, address, and notifications.
+        The profile (with its JSON-serialized fields) is only rebuilt after the user changed;
+        exports and reports calling this for every user reuse the cached one otherwise.
+        Subclasses extend _build_profile, not this method.
+        """
+        if self._profile_dirty:
+            self._profile_cache = self._build_profile()
+            self._profile_dirty = False
+        return dict(self._profile_cache) # A copy, so callers can't modify the cache
+
+    def _build_profile(self) -> dict:
+        """
+        Builds the profile returned by get_profile.
         Converts lists/dicts to JSON strings for export compatibility.
         """
         profile = {
@@ -110,8 +175,9 @@ class User(AbstractRole):
             "created_at": self.created_at,
             "phone": self.phone if self.phone is not None else "", # Handle None values for export
             "address": self.address if self.address is not None else "", # Handle None values for export
-            # Convert list of Notification objects' info to a JSON string
-            "notifications": json.dumps([n.get_notification_info() for n in self._notifications])
+            # Convert list of Notification objects' info to a JSON string (same output as json_dumps of the list,
+            # but each notification's JSON is cached instead of rebuilt on every export)
+            "notifications": "[" + ",".join([n.get_notification_json() for n in self._notifications.values()]) + "]"
         }
         return profile
 
@@ -125,54 +191,95 @@ class User(AbstractRole):
         if 'email' in kwargs:
             self._email = kwargs['email']
         if 'password' in kwargs:
-            self._password_hash = self._hash_password(kwargs['password'])
+            self._set_password(kwargs['password']) # New password, new salt
         if 'phone' in kwargs:
             self.phone = kwargs['phone']
         if 'address' in kwargs:
             self.address = kwargs['address']
+        self._invalidate_profile()
 
-    def add_notification(self, message: str, priority: str = "normal"):
+    def add_notification(self, message: str, priority: str = "normal", created_at: str = None):
         """
         Adds a new notification to the user's list.
-        """
-        notification = Notification(message, self.id, priority=priority)
-        self._notifications.append(notification)
+        created_at can be given to share one timestamp across notifications sent together.
+        Only the latest MAX_NOTIFICATIONS are kept; the oldest one is dropped to make room.
+        """
+        notification = Notification(message, self.id, priority=priority, created_at=created_at)
+        if len(self._notifications) >= MAX_NOTIFICATIONS:
+            oldest_id = next(iter(self._notifications)) # Dicts keep creation order
+            oldest = self._notifications.pop(oldest_id)
+            del self._notifications_by_priority[oldest.priority][oldest_id]
+        self._notifications[notification.id] = notification
+        self._notifications_by_priority.setdefault(notification.priority, {})[notification.id] = notification
+        self._invalidate_profile()
 
     def view_notifications(self, filter_read: bool = False, filter_priority: str = None) -> list:
         """
         Views notifications, with optional filters for read status and priority.
+        A priority filter only walks the notifications of that priority.
         Returns a list of notification information.
         """
-        filtered_notifications = []
-        for notif in self._notifications:
-            if filter_read and notif.is_read:
-                continue
-            if filter_priority and notif.priority.lower() != filter_priority.lower():
-                continue
-            filtered_notifications.append(notif.get_notification_info())
-        return filtered_notifications
+        if filter_priority:
+            notifications = self._notifications_by_priority.get(filter_priority.lower(), {}).values()
+        else:
+            notifications = self._notifications.values()
+        return [notif.get_notification_info() for notif in notifications if not (filter_read and notif.is_read)]
 
     def delete_notification(self, notification_id: int) -> bool:
         """
         Deletes a notification by its ID.
         Returns True if the notification was found and deleted, False otherwise.
         """
-        original_len = len(self._notifications)
-        self._notifications = [n for n in self._notifications if n.id != notification_id]
-        return len(self._notifications) < original_len
+        notification = self._notifications.pop(notification_id, None)
+        if notification is None:
+            return False
+        del self._notifications_by_priority[notification.priority][notification_id]
+        self._invalidate_profile()
+        return True
+
+    def mark_notification_read(self, notification_id: int) -> bool:
+        """
+        Marks a notification as read. The profile lists the notifications, so it changes too.
+        Returns True if the notification was found, False otherwise.
+        """
+        notification = self._notifications.get(notification_id)
+        if notification is None:
+            return False
+        if not notification.is_read:
+            notification.mark_as_read()
+            self._invalidate_profile()
+        return True
 
     def authenticate(self, password: str) -> bool:
         """
         Authenticates the user by checking the provided password against the stored hash.
         Returns True if authentication is successful, False otherwise.
         """
-        return self._hash_password(password) == self._password_hash
+        if self._password_hash is None:
+            return False # Password not set yet (see _set_password)
+        password_hash = self._hash_password(password, self._password_salt, *self._password_cost)
+        return hmac.compare_digest(password_hash, self._password_hash) # Constant-time comparison
+
+    @staticmethod
+    def authenticate_batch(attempts: list[tuple[User, str]]) -> list[bool]:
+        """
+        Authenticates many (user, password) pairs at once, e.g. during a burst of logins.
+        The checks are independent and scrypt runs outside the GIL, so they are spread over the CPU cores.
+        Returns one result per attempt, in order.
+        """
+        if len(attempts) <= 1:
+            return [user.authenticate(password) for user, password in attempts]
+        max_workers = min(len(attempts), os.cpu_count() or 1)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda attempt: attempt[0].authenticate(attempt[1]), attempts))
 
 class Student(User):
     """
     Represents a student in the EduPlatform, inheriting from User.
     Handles student-specific data like grades, subjects, and assignments.
     """
+    __slots__ = ('grade', 'subjects', 'assignments', 'grades', '_grade_totals', '_grade_sum_all', '_grade_count_all')
+
     def __init__(self, full_name: str, email: str, password: str, grade_level: str):
         """
         Initializes a Student instance.
@@ -183,23 +290,26 @@ class Student(User):
         grades: Student's grades (dict: {subject: [grade1, grade2, ...]})
         """
         super().__init__(full_name, email, password, UserRole.STUDENT)
-        self.grade = grade_level # e.g., "9-A"
+        self.grade = sys.intern(grade_level) # e.g., "9-A"; interned, as the key students are grouped by class with
         self.subjects = {} # {subject_name: teacher_id}
         self.assignments = {} # {assignment_id: status}
-        self.grades = {} # {subject: [grade1, grade2, ...]}
+        self.grades = {} # {subject: [grade1, grade2, ...]}, change through add_grade so the running averages stay valid
+        self._grade_totals = {} # {subject: [sum, count]} of the grades, maintained by add_grade
+        self._grade_sum_all = 0 # Sum of all grades, maintained by add_grade
+        self._grade_count_all = 0 # Number of all grades, maintained by add_grade
 
-    def get_profile(self) -> dict:
+    def _build_profile(self) -> dict:
         """
-        Overrides User.get_profile to include student-specific details.
+        Overrides User._build_profile to include student-specific details.
         Converts lists/dicts to JSON strings for export compatibility.
         """
-        profile = super().get_profile()
+        profile = super()._build_profile()
         profile.update({
             "grade_level": self.grade,
             # Convert dictionaries to JSON strings
-            "subjects_enrolled": json.dumps(self.subjects),
-            "current_assignments_status": json.dumps(self.assignments),
-            "all_grades": json.dumps(self.grades)
+            "subjects_enrolled": json_dumps(self.subjects),
+            "current_assignments_status": json_dumps(self.assignments),
+            "all_grades": json_dumps(self.grades)
         })
         return profile
 
@@ -208,44 +318,47 @@ class Student(User):
         Updates the student's profile information.
         Allows updating base User attributes and student-specific 'grade'.
         """
-        super().update_profile(**kwargs)
         if 'grade_level' in kwargs:
-            self.grade = kwargs['grade_level']
+            self.grade = sys.intern(kwargs['grade_level'])
+        super().update_profile(**kwargs) # Last, so the change listener sees the new class
 
-    def submit_assignment(self, assignment_id: int, content: str, all_assignments: dict) -> bool:
+    def submit_assignment(self, assignment_id: int, content: str, all_assignments: dict,
+                          today: datetime.date = None) -> bool:
         """
         Submits an assignment.
         Checks for deadline and content length restrictions.
+        today is the date checked against the deadline, defaulting to the current date;
+        callers submitting many at once (e.g. an import) read the clock once and pass it in.
         Returns True if submission is successful, False otherwise.
         """
-        # Ensure Assignment is correctly imported from models.assignments
-        # (This is already handled at the top of the file)
-        
+        # Reject oversized content first, so it is never stored (not even as a late submission)
+        if len(content) > MAX_SUBMISSION_CHARS:
+            logger.warning("Error: Assignment content exceeds %s characters. Current length: %s", MAX_SUBMISSION_CHARS, len(content))
+            return False
+
         assignment: Assignment = all_assignments.get(assignment_id)
         if not assignment:
-            print(f"Error: Assignment with ID {assignment_id} not found.")
+            logger.warning("Error: Assignment with ID %s not found.", assignment_id)
             return False
 
         # --- CORRECTED DEADLINE COMPARISON ---
         # self.deadline in Assignment is a datetime.date object.
         # Compare dates directly.
-        today = datetime.date.today()
+        if today is None:
+            today = datetime.date.today()
         is_late = today > assignment.deadline
 
         if is_late:
-            print(f"Error: Assignment {assignment_id} deadline has passed. Submission marked as late.")
+            logger.warning("Error: Assignment %s deadline has passed. Submission marked as late.", assignment_id)
             assignment.add_submission(self.id, content, is_late=True)
             self.assignments[assignment_id] = AssignmentStatus.LATE_SUBMISSION.value
+            self._invalidate_profile()
             return False # Return False as it was a late submission, not an "on-time success"
 
-        # Check content length restriction (e.g., max 500 characters)
-        if len(content) > 500:
-            print(f"Error: Assignment content exceeds 500 characters. Current length: {len(content)}")
-            return False
-            
         assignment.add_submission(self.id, content) # Add submission to the assignment
         self.assignments[assignment_id] = AssignmentStatus.SUBMITTED.value # Update student's assignment status
-        print(f"Assignment {assignment_id} submitted successfully by {self.full_name}.")
+        self._invalidate_profile()
+        logger.info("Assignment %s submitted successfully by %s.", assignment_id, self.full_name)
         return True
 
     def view_grades(self, subject: str = None) -> dict:
@@ -257,59 +370,73 @@ class Student(User):
             if subject in self.grades:
                 return {subject: self.grades[subject]}
             else:
-                print(f"No grades found for subject: {subject}")
+                logger.warning("No grades found for subject: %s", subject)
                 return {}
         return self.grades
 
+    def add_grade(self, subject: str, grade_value: int):
+        """
+        Adds a grade to the student's grades for a subject.
+        Every grade counts, including equal values for different assignments.
+        """
+        self.grades.setdefault(subject, []).append(grade_value)
+        # Keep the running totals behind calculate_average_grade up to date
+        subject_totals = self._grade_totals.setdefault(subject, [0, 0])
+        subject_totals[0] += grade_value
+        subject_totals[1] += 1
+        self._grade_sum_all += grade_value
+        self._grade_count_all += 1
+        self._invalidate_profile()
+
     def calculate_average_grade(self, subject: str = None) -> float:
         """
         Calculates the average grade for a student, optionally by subject.
+        Uses running sums and counts kept by add_grade, so it takes constant time.
         Returns the average grade as a float.
         """
-        grades_to_avg = []
         if subject:
-            if subject in self.grades:
-                grades_to_avg.extend(self.grades[subject])
+            grade_sum, grade_count = self._grade_totals.get(subject, (0, 0))
         else:
-            for sub_grades in self.grades.values():
-                grades_to_avg.extend(sub_grades)
+            grade_sum, grade_count = self._grade_sum_all, self._grade_count_all
 
-        if not grades_to_avg:
+        if not grade_count:
             return 0.0 # No grades to calculate
 
-        return sum(grades_to_avg) / len(grades_to_avg)
+        return grade_sum / grade_count
 
 class Teacher(User):
     """
     Represents a teacher in the EduPlatform, inheriting from User.
     Handles teacher-specific data like subjects taught, classes, and assignments given.
     """
+    __slots__ = ('subjects', 'classes', 'assignments', 'workload')
+
     def __init__(self, full_name: str, email: str, password: str):
         """
         Initializes a Teacher instance.
         Attributes:
-        subjects: Subjects taught (list of str)
-        classes: Classes taught (list of str)
+        subjects: Subjects taught (set of str, for O(1) membership checks when grading)
+        classes: Classes taught (set of str)
         assignments: Assignments given (dict: {assignment_id: Assignment object})
         """
         super().__init__(full_name, email, password, UserRole.TEACHER)
-        self.subjects = [] # List of subjects taught
-        self.classes = [] # List of class IDs taught
+        self.subjects = set() # Set of subjects taught
+        self.classes = set() # Set of class IDs taught
         self.assignments = {} # {assignment_id: Assignment object}
         self.workload = 0 # Teaching hours/workload
 
-    def get_profile(self) -> dict:
+    def _build_profile(self) -> dict:
         """
-        Overrides User.get_profile to include teacher-specific details.
+        Overrides User._build_profile to include teacher-specific details.
         Converts lists/dicts to JSON strings for export compatibility.
         """
-        profile = super().get_profile()
+        profile = super()._build_profile()
         profile.update({
             # Convert lists to JSON strings
-            "subjects_taught": json.dumps(self.subjects),
-            "classes_taught": json.dumps(self.classes),
+            "subjects_taught": json_dumps(sorted(self.subjects)),
+            "classes_taught": json_dumps(sorted(self.classes)),
             # Convert list of assignment info dictionaries to a JSON string
-            "assignments_created": json.dumps([a.get_assignment_info() for a in self.assignments.values()]),
+            "assignments_created": json_dumps([a.get_assignment_info() for a in self.assignments.values()]),
             "workload": self.workload
         })
         return profile
@@ -321,9 +448,9 @@ class Teacher(User):
         """
         super().update_profile(**kwargs)
         if 'subjects' in kwargs and isinstance(kwargs['subjects'], list):
-            self.subjects = list(set(self.subjects + kwargs['subjects'])) # Add new subjects, avoid duplicates
+            self.subjects.update(map(sys.intern, kwargs['subjects'])) # Add new subjects (interned), avoid duplicates
         if 'classes' in kwargs and isinstance(kwargs['classes'], list):
-            self.classes = list(set(self.classes + kwargs['classes'])) # Add new classes, avoid duplicates
+            self.classes.update(map(sys.intern, kwargs['classes'])) # Add new classes (interned), avoid duplicates
         if 'workload' in kwargs and isinstance(kwargs['workload'], (int, float)):
             self.workload = kwargs['workload']
 
@@ -347,6 +474,7 @@ class Teacher(User):
         )
         self.assignments[new_assignment.id] = new_assignment # Add to teacher's assignments
         all_assignments[new_assignment.id] = new_assignment # Add to global assignments list
+        self._invalidate_profile()
         print(f"Assignment '{title}' created by {self.full_name} for {class_id}.")
         return new_assignment
 
@@ -356,42 +484,36 @@ class Teacher(User):
         Grades a student's submission for a given assignment.
         Updates the assignment's grades and the student's grades.
         """
-        # Ensure Assignment and Grade are correctly imported from their respective models
+        # Ensure Assignment is correctly imported from its model
         # (This is already handled at the top of the file)
         
         assignment: Assignment = all_assignments.get(assignment_id)
         student: Student = all_students.get(student_id)
 
         if not assignment:
-            print(f"Error: Assignment with ID {assignment_id} not found.")
+            logger.warning("Error: Assignment with ID %s not found.", assignment_id)
             return False
         if not student:
-            print(f"Error: Student with ID {student_id} not found.")
+            logger.warning("Error: Student with ID %s not found.", student_id)
             return False
         if student_id not in assignment.submissions:
-            print(f"Error: Student {student.full_name} has not submitted this assignment.")
+            logger.warning("Error: Student %s has not submitted this assignment.", student.full_name)
             return False
-        if not (1 <= grade_value <= 5):
-            print("Error: Grade value must be between 1 and 5.")
+        if grade_value not in VALID_GRADES:
+            logger.warning("Error: Grade value must be between 1 and 5.")
             return False
             
         # Set grade in Assignment object
         assignment.set_grade(student_id, grade_value) # Sets grade and updates status in assignment
 
-        # Add or update grade in student's grades list
-        if assignment.subject not in student.grades:
-            student.grades[assignment.subject] = []
-        
-        # Simple check to prevent adding the exact same grade value multiple times for the same subject
-        if grade_value not in student.grades[assignment.subject]:
-             student.grades[assignment.subject].append(grade_value)
+        # Add grade to the student's grades list (this also invalidates the student's cached profile)
+        student.add_grade(assignment.subject, grade_value)
+        self._invalidate_profile() # The assignment in assignments_created changed
 
-        # Create a Grade object (from models/grades.py)
-        new_grade = Grade(student_id, assignment_id, assignment.subject, grade_value, self.id)
-        # In a real system, `new_grade` would typically be stored in a central grades collection/dictionary
-        # For example, if you have a `platform.grades` dict in your EduPlatform class.
+        # The Grade record itself (models/grades.py) is created and stored by the caller,
+        # e.g. EduPlatform.grade_assignment keeps it in platform.grades
 
-        print(f"Assignment {assignment_id} for student {student.full_name} graded: {grade_value}")
+        logger.info("Assignment %s for student %s graded: %s", assignment_id, student.full_name, grade_value)
         return True
 
     def view_student_progress(self, student_id: int, all_students: dict) -> dict:
@@ -401,7 +523,7 @@ class Teacher(User):
         """
         student: Student = all_students.get(student_id)
         if not student:
-            print(f"Error: Student with ID {student_id} not found.")
+            logger.warning("Error: Student with ID %s not found.", student_id)
             return {}
 
         progress_report = {
@@ -421,27 +543,62 @@ class Parent(User):
     Represents a parent in the EduPlatform, inheriting from User.
     Allows parents to monitor their children's academic progress.
     """
+    __slots__ = ('children', 'notification_preferences', '_child_refs')
+
     def __init__(self, full_name: str, email: str, password: str, children_ids: list[int] = None):
         """
         Initializes a Parent instance.
         Attributes:
-        children: List of Student IDs of their children (list of int)
+        children: Student IDs of their children (set of int, for O(1) membership checks)
         notification_preferences: Preferences for child-related notifications (dict)
         """
         super().__init__(full_name, email, password, UserRole.PARENT)
-        self.children = children_ids if children_ids is not None else [] # List of student IDs
+        self.children = set(children_ids or ()) # Set of student IDs
         self.notification_preferences = {"low_grade_alert": True} # Default preferences
+        self._child_refs = {} # {student_id: Student} for children linked with add_child, read without a users lookup
 
-    def get_profile(self) -> dict:
+    def add_child(self, child: Student):
+        """Links a child to this parent, keeping the Student object itself for direct access."""
+        self.children.add(child.id)
+        self._child_refs[child.id] = child
+        self._invalidate_profile()
+
+    def remove_child(self, child_id: int) -> bool:
+        """Unlinks a child from this parent. Returns False if it was not their child."""
+        self._child_refs.pop(child_id, None)
+        if child_id not in self.children:
+            return False
+        self.children.remove(child_id)
+        self._invalidate_profile()
+        return True
+
+    def _get_child(self, child_id: int, all_students: dict = None) -> Student | None:
         """
-        Overrides User.get_profile to include parent-specific details.
+        Returns one of this parent's children, from the linked Student objects when possible,
+        otherwise by looking the ID up in all_students (the platform's users dict), if given.
+        """
+        if child_id not in self.children:
+            logger.warning("Error: Child with ID %s is not registered as your child.", child_id)
+            return None
+
+        child = self._child_refs.get(child_id)
+        if child is None and all_students is not None:
+            child = all_students.get(child_id)
+        if not child:
+            logger.warning("Error: Child with ID %s not found in the system.", child_id)
+            return None
+        return child
+
+    def _build_profile(self) -> dict:
+        """
+        Overrides User._build_profile to include parent-specific details.
         Converts lists/dicts to JSON strings for export compatibility.
         """
-        profile = super().get_profile()
+        profile = super()._build_profile()
         profile.update({
             # Convert lists/dicts to JSON strings
-            "children_ids": json.dumps(self.children),
-            "notification_preferences": json.dumps(self.notification_preferences)
+            "children_ids": json_dumps(sorted(self.children)),
+            "notification_preferences": json_dumps(self.notification_preferences)
         })
         return profile
 
@@ -450,42 +607,33 @@ class Parent(User):
         Updates the parent's profile information.
         Allows updating base User attributes and parent-specific 'notification_preferences'.
         """
-        super().update_profile(**kwargs)
         if 'children' in kwargs and isinstance(kwargs['children'], list):
-            self.children = list(set(self.children + kwargs['children']))
+            self.children.update(kwargs['children'])
         if 'notification_preferences' in kwargs and isinstance(kwargs['notification_preferences'], dict):
             self.notification_preferences.update(kwargs['notification_preferences'])
+        super().update_profile(**kwargs) # Last, so the change listener sees the new children
 
-    def view_child_grades(self, child_id: int, all_students: dict) -> dict:
+    def view_child_grades(self, child_id: int, all_students: dict = None) -> dict:
         """
         Views a specific child's grades.
+        Children linked with add_child are read directly; all_students (the platform's users dict)
+        is only needed for children that were added by ID alone.
+        (The reverse direction, child -> parents, is indexed in EduPlatform.parents_of_student.)
         Returns the child's grades dictionary.
         """
-        if child_id not in self.children:
-            print(f"Error: Child with ID {child_id} is not registered as your child.")
+        child = self._get_child(child_id, all_students)
+        if child is None:
             return {}
-        
-        child: Student = all_students.get(child_id)
-        if not child:
-            print(f"Error: Child with ID {child_id} not found in the system.")
-            return {}
-        
         return child.view_grades()
 
-    def view_child_assignments(self, child_id: int, all_students: dict) -> dict:
+    def view_child_assignments(self, child_id: int, all_students: dict = None) -> dict:
         """
         Views a specific child's assignments and their statuses.
         Returns the child's assignments dictionary.
         """
-        if child_id not in self.children:
-            print(f"Error: Child with ID {child_id} is not registered as your child.")
+        child = self._get_child(child_id, all_students)
+        if child is None:
             return {}
-        
-        child: Student = all_students.get(child_id)
-        if not child:
-            print(f"Error: Child with ID {child_id} not found in the system.")
-            return {}
-        
         return child.assignments
 
     def receive_child_notification(self, child_id: int, message: str, priority: str = "normal"):
@@ -496,31 +644,41 @@ class Parent(User):
             self.add_notification(f"Regarding child {child_id}: {message}", priority=priority)
             print(f"Parent {self.full_name} received notification about child {child_id}.")
         else:
-            print(f"Error: Child with ID {child_id} is not associated with this parent.")
+            logger.warning("Error: Child with ID %s is not associated with this parent.", child_id)
 
 class Admin(User):
     """
     Represents an administrator in the EduPlatform, inheriting from User.
     Has system-level control, including user management and report generation.
     """
+    __slots__ = ('permissions',)
+
+    # Builds the new user for add_user, by role (the classes are looked up when a builder is called)
+    _ROLE_FACTORIES = {
+        UserRole.STUDENT: lambda d: Student(d["full_name"], d["email"], d["password"], d["grade_level"]),
+        UserRole.TEACHER: lambda d: Teacher(d["full_name"], d["email"], d["password"]),
+        UserRole.PARENT: lambda d: Parent(d["full_name"], d["email"], d["password"], children_ids=d.get("children_ids")),
+        UserRole.ADMIN: lambda d: Admin(d["full_name"], d["email"], d["password"]),
+    }
+
     def __init__(self, full_name: str, email: str, password: str):
         """
         Initializes an Admin instance.
         Attributes:
-        permissions: List of permissions (list of str)
+        permissions: Permissions (set of str)
         """
         super().__init__(full_name, email, password, UserRole.ADMIN)
-        self.permissions = ["manage_users", "generate_reports", "system_settings"] # Default permissions
+        self.permissions = {"manage_users", "generate_reports", "system_settings"} # Default permissions
 
-    def get_profile(self) -> dict:
+    def _build_profile(self) -> dict:
         """
-        Overrides User.get_profile to include admin-specific details.
+        Overrides User._build_profile to include admin-specific details.
         Converts lists/dicts to JSON strings for export compatibility.
         """
-        profile = super().get_profile()
+        profile = super()._build_profile()
         profile.update({
             # Convert list to JSON string
-            "permissions": json.dumps(self.permissions)
+            "permissions": json_dumps(sorted(self.permissions))
         })
         return profile
 
@@ -531,49 +689,100 @@ class Admin(User):
         """
         super().update_profile(**kwargs)
         if 'permissions' in kwargs and isinstance(kwargs['permissions'], list):
-            self.permissions = list(set(self.permissions + kwargs['permissions'])) # Add new permissions, avoid duplicates
+            self.permissions.update(kwargs['permissions']) # Add new permissions, avoid duplicates
 
-    def add_user(self, user_data: dict, all_users: dict) -> User:
+    def _user_factory(self, user_data: dict):
         """
-        Adds a new user to the system based on provided user data.
-        Returns the created User object.
+        Validates the data for a new user and returns the builder for its role,
+        or None (after logging why) if the data is incomplete or the role is unknown.
+        The role may be a UserRole or its name in any case (e.g. "student").
         """
-        # Specific imports for type checking within this method
-        from models.users import Student, Teacher, Parent, Admin # Ensure these are imported relative to models.users
-        
-        role_str = user_data.get("role", "").lower()
-        full_name = user_data.get("full_name")
-        email = user_data.get("email")
-        password = user_data.get("password")
+        # Checked one by one (stopping at the first gap) so the message names the missing field
+        for field in ("full_name", "email", "password", "role"):
+            if not user_data.get(field):
+                logger.warning("Error: Missing required user data '%s' (full_name, email, password, role).", field)
+                return None
 
-        if not all([full_name, email, password, role_str]):
-            print("Error: Missing required user data (full_name, email, password, role).")
+        role = user_data["role"]
+        if not isinstance(role, UserRole):
+            role = _ROLE_BY_NAME.get(role.lower(), role)
+
+        factory = self._ROLE_FACTORIES.get(role)
+        if factory is None:
+            logger.warning("Error: Invalid user role '%s'.", role)
+            return None
+        if role is UserRole.STUDENT and not user_data.get("grade_level"):
+            logger.warning("Error: Student requires 'grade_level'.")
             return None
+        return factory
 
-        new_user = None
-        if role_str == UserRole.STUDENT.value.lower():
-            grade_level = user_data.get("grade_level")
-            if not grade_level:
-                print("Error: Student requires 'grade_level'.")
-                return None
-            new_user = Student(full_name, email, password, grade_level)
-        elif role_str == UserRole.TEACHER.value.lower():
-            new_user = Teacher(full_name, email, password)
-        elif role_str == UserRole.PARENT.value.lower():
-            # Pass children_ids if provided in user_data
-            children_ids = user_data.get("children_ids")
-            new_user = Parent(full_name, email, password, children_ids=children_ids)
-        elif role_str == UserRole.ADMIN.value.lower():
-            new_user = Admin(full_name, email, password)
-        else:
-            print(f"Error: Invalid user role '{role_str}'.")
+    def add_user(self, user_data: dict, platform: 'EduPlatform') -> User:
+        """
+        Adds a new user to the platform based on provided user data.
+        The role may be a UserRole or its name in any case (e.g. "student").
+        The user is stored through platform.store_user, so it is indexed like a registered user.
+        Returns the created User object, or None if the data was invalid or the email is taken.
+        """
+        factory = self._user_factory(user_data)
+        if factory is None:
             return None
+        if user_data["email"] in platform.users_by_email: # Checked before the (slow) password hash
+            logger.warning("Error: User with email '%s' already exists.", user_data["email"])
+            return None
+        new_user = factory(user_data)
+        if not platform.store_user(new_user):
+            return None
+        platform.export_data_on_change()
+        print(f"User '{new_user.full_name}' with role {new_user.role.value} added.")
+        return new_user
+
+    def add_users_bulk(self, user_data_list: list[dict], platform: 'EduPlatform') -> list:
+        """
+        Adds many users at once, e.g. when importing a class list.
+        The users are created in order (so their IDs follow the input), without hashing their
+        passwords; the independent scrypt hashes are then computed in parallel, as scrypt runs
+        outside the GIL. Only then are the users stored one by one through platform.store_user.
+        Returns one entry per input: the new User, or None if its data was invalid or its email
+        is taken (on the platform or earlier in the list).
+        """
+        new_users = []
+        passwords = []
+        batch_emails = set()
+        for user_data in user_data_list:
+            factory = self._user_factory(user_data)
+            if factory is None:
+                new_users.append(None)
+                continue
+            email = user_data["email"]
+            if email in platform.users_by_email or email in batch_emails:
+                logger.warning("Error: User with email '%s' already exists.", email)
+                new_users.append(None)
+                continue
+            batch_emails.add(email)
+            new_user = factory({**user_data, "password": None}) # Hashed below
+            new_users.append(new_user)
+            passwords.append((new_user, user_data["password"]))
+
+        if len(passwords) <= 1:
+            for new_user, password in passwords:
+                new_user._set_password(password)
+        else:
+            max_workers = min(len(passwords), os.cpu_count() or 1)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(lambda entry: entry[0]._set_password(entry[1]), passwords))
 
-        if new_user:
-            all_users[new_user.id] = new_user # Add to the global users dictionary
-            print(f"User '{new_user.full_name}' with role {new_user.role.value} added.")
-            return new_user
-        return None
+        added_count = 0
+        for position, new_user in enumerate(new_users):
+            if new_user is None:
+                continue
+            if platform.store_user(new_user): # Only stored once the password is set
+                added_count += 1
+            else:
+                new_users[position] = None
+        if added_count:
+            platform.export_data_on_change()
+        print(f"{added_count} of {len(user_data_list)} user(s) added.")
+        return new_users
 
     def remove_user(self, user_id: int, all_users: dict) -> bool:
         """
@@ -585,62 +794,90 @@ class Admin(User):
             del all_users[user_id]
             print(f"User with ID {user_id} removed.")
             return True
-        print(f"Error: User with ID {user_id} not found.")
+        logger.warning("Error: User with ID %s not found.", user_id)
         return False
 
+    @staticmethod
+    def _users_with_role(all_data: dict, role: UserRole, role_class: type):
+        """
+        Returns the users of one role, from the platform's per-role index when it is passed in
+        (so reports don't walk and type-check every user), otherwise by filtering all users.
+        """
+        users_by_role = all_data.get("users_by_role")
+        if users_by_role is not None:
+            return users_by_role[role].values()
+        return [user for user in all_data['users'].values() if isinstance(user, role_class)]
+
+    # Each report is built by one handler from the users of a single role. The per-user reports only
+    # depend on their own user, so they are built in a single comprehension each.
+    @staticmethod
+    def _student_success_report(students) -> dict:
+        """Builds the "student_success" report: each student's overall average and grades by subject."""
+        return {
+            user.full_name: {
+                "average_overall_grade": user.calculate_average_grade(),
+                # For reports, it's fine to keep this as a dict for analysis within Python
+                # If this report itself is exported to Excel, then you'd JSON-serialize again.
+                "grades_by_subject": user.view_grades()
+            }
+            for user in students
+        }
+
+    @staticmethod
+    def _teacher_workload_report(teachers) -> dict:
+        """Builds the "teacher_workload" report: per teacher, what they teach and how much."""
+        return {
+            user.full_name: {
+                "subjects_taught_count": len(user.subjects),
+                "classes_taught_count": len(user.classes),
+                "assignments_created_count": len(user.assignments),
+                "current_workload_hours": user.workload
+            }
+            for user in teachers
+        }
+
+    @staticmethod
+    def _class_statistics_report(students) -> dict:
+        """Builds the "class_statistics" report: per class, its students and their average grade."""
+        # One pass over the students: per class, collect the student rows and a running
+        # total of their (constant-time) averages; the class average is derived afterwards.
+        class_students = {} # {class: list of student rows}
+        class_totals = {}   # {class: sum of student averages}
+        for user in students:
+            avg_grade = user.calculate_average_grade()
+            class_students.setdefault(user.grade, []).append({
+                "id": user.id, "name": user.full_name, "avg_grade": avg_grade
+            })
+            class_totals[user.grade] = class_totals.get(user.grade, 0) + avg_grade
+
+        return {
+            grade: {
+                "total_students": len(students_data),
+                "students_data": students_data,
+                "average_class_grade": class_totals[grade] / len(students_data)
+            }
+            for grade, students_data in class_students.items()
+        }
+
+    # {report_type: (role the report is about, its class, handler)}, looked up once per report
+    _REPORT_BUILDERS = {
+        "student_success": (UserRole.STUDENT, Student, _student_success_report),
+        "teacher_workload": (UserRole.TEACHER, Teacher, _teacher_workload_report),
+        "class_statistics": (UserRole.STUDENT, Student, _class_statistics_report),
+    }
+    REPORT_TYPES = tuple(_REPORT_BUILDERS) # Accepted by generate_report
+
     def generate_report(self, report_type: str, all_data: dict) -> dict:
         """
         Generates various system reports.
         Report types: "student_success", "teacher_workload", "class_statistics".
         """
-        report_data = {}
-        if report_type == "student_success":
-            report_data["student_success"] = {}
-            for user_id, user in all_data['users'].items():
-                if isinstance(user, Student):
-                    report_data["student_success"][user.full_name] = {
-                        "average_overall_grade": user.calculate_average_grade(),
-                        # For reports, it's fine to keep this as a dict for analysis within Python
-                        # If this report itself is exported to Excel, then you'd JSON-serialize again.
-                        "grades_by_subject": user.view_grades()
-                    }
-            print("Student success report generated.")
-        elif report_type == "teacher_workload":
-            report_data["teacher_workload"] = {}
-            for user_id, user in all_data['users'].items():
-                if isinstance(user, Teacher):
-                    report_data["teacher_workload"][user.full_name] = {
-                        "subjects_taught_count": len(user.subjects),
-                        "classes_taught_count": len(user.classes),
-                        "assignments_created_count": len(user.assignments),
-                        "current_workload_hours": user.workload
-                    }
-            print("Teacher workload report generated.")
-        elif report_type == "class_statistics":
-            class_stats = {}
-            for user_id, user in all_data['users'].items():
-                if isinstance(user, Student):
-                    if user.grade not in class_stats:
-                        class_stats[user.grade] = {"total_students": 0, "total_avg_grade": 0, "students_data": []}
-                    
-                    class_stats[user.grade]["total_students"] += 1
-                    avg_grade = user.calculate_average_grade()
-                    class_stats[user.grade]["total_avg_grade"] += avg_grade
-                    class_stats[user.grade]["students_data"].append({
-                        "id": user.id, "name": user.full_name, "avg_grade": avg_grade
-                    })
-            
-            for grade, stats in class_stats.items():
-                if stats["total_students"] > 0:
-                    stats["average_class_grade"] = stats["total_avg_grade"] / stats["total_students"]
-                else:
-                    stats["average_class_grade"] = 0
-                del stats["total_avg_grade"]
-            
-            report_data["class_statistics"] = class_stats
-            print("Class statistics report generated.")
-        else:
-            print(f"Error: Unknown report type '{report_type}'.")
+        builder = self._REPORT_BUILDERS.get(report_type)
+        if builder is None:
+            logger.warning("Error: Unknown report type '%s'.", report_type)
             return {}
-        
+
+        role, role_class, build_report = builder
+        report_data = {report_type: build_report(self._users_with_role(all_data, role, role_class))}
+        print(f"{report_type.replace('_', ' ').capitalize()} report generated.")
         return report_data
\ No newline at end of file